@@ -10,5 +10,12 @@ __all__ = ["ps2000",
            "ps5000a",
            "ps6000"]
 
-from . import _version
-__version__ = _version.get_versions()['version']
+
+def __getattr__(name):
+    # Working out the version can mean running git, so only do it on demand.
+    if name == "__version__":
+        from . import _version
+        version = _version.get_versions()['version']
+        globals()['__version__'] = version
+        return version
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
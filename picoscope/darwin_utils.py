@@ -1,5 +1,7 @@
 from ctypes import cdll
 from pathlib import Path
+import hashlib
+import os
 import shutil
 import subprocess
 import tempfile
@@ -13,6 +15,9 @@ def LoadLibraryDarwin(library):
     here:
 
     http://ulthiel.com/vk2utl/picoscope-python-interface-under-mac-os-x/
+
+    The patched libraries are kept under ~/Library/Caches/pico-python so
+    that they are only copied and patched once per PicoScope installation.
     """
     PICO_LIB_PATH = "/Applications/PicoScope6.app/Contents/Resources/lib/"
 
@@ -31,30 +36,62 @@ def LoadLibraryDarwin(library):
             raise FileNotFoundError(
                     "/Applications/PicoScope6.app is missing")
 
-        # Modifying the libraries in-place breaks their signatures, causing
-        # PicoScope6.app to fail to detect the oscilloscope.  Instead, patch
-        # copies of the libraries in a temporary directory.
-        tempLibDir = tempfile.TemporaryDirectory()
-        patchedPicoPath = tempLibDir.name + "/lib/"
-        shutil.copytree(PICO_LIB_PATH, patchedPicoPath)
+        # A new PicoScope installation gets a new cache directory.
+        signature = hashlib.sha1(
+            (PICO_LIB_PATH + str(os.path.getmtime(PICO_LIB_PATH))
+             ).encode('utf-8')).hexdigest()[:16]
+        cacheDir = Path.home() / "Library" / "Caches" / "pico-python"
+        patchedPicoPath = str(cacheDir / signature) + "/"
+
+        if not Path(patchedPicoPath).is_dir():
+            _patchLibraries(PICO_LIB_PATH, cacheDir, patchedPicoPath,
+                            IOMP5_DEPS)
+
+        return cdll.LoadLibrary(patchedPicoPath + library)
+
+
+def _patchLibraries(picoLibPath, cacheDir, patchedPicoPath, iomp5Deps):
+    """Copy and patch the PicoScope libraries into `patchedPicoPath`."""
+    # Modifying the libraries in-place breaks their signatures, causing
+    # PicoScope6.app to fail to detect the oscilloscope.  Instead, patch
+    # copies of the libraries. This is done in a scratch directory that is
+    # only renamed into place once complete, so that an interrupted or
+    # concurrent run never leaves a half patched cache behind.
+    cacheDir.mkdir(parents=True, exist_ok=True)
+    scratchDir = tempfile.mkdtemp(dir=str(cacheDir))
+    scratchPath = scratchDir + "/lib/"
+    try:
+        shutil.copytree(picoLibPath, scratchPath)
+
+        # Every library is patched by its own install_name_tool process,
+        # so they can all run at the same time.
+        commands = []
 
         # Patch libraries that depend on libiomp5.dylib to refer to it by an
         # absolute path instead of a relative path, which is not allowed by
         # SIP.
-        for libraryToPatch in IOMP5_DEPS:
-            subprocess.run(["install_name_tool", "-change", "libiomp5.dylib",
-                            patchedPicoPath + "/libiomp5.dylib",
-                            patchedPicoPath + "/" + libraryToPatch
-                            ]).check_returncode()
-
-        # Finally, patch the originally requested library to look in the
-        # patched directory.
-        patchedLibrary = patchedPicoPath + "/" + library
-        subprocess.run(["install_name_tool", "-add_rpath", patchedPicoPath,
-                        patchedLibrary]).check_returncode()
-        loadedLibrary = cdll.LoadLibrary(patchedLibrary)
-
-        # Sneak the directory into the library so it's not deleted until the
-        # library is garbage collected.
-        loadedLibrary.tempLibDir = tempLibDir
-        return loadedLibrary
+        for libraryToPatch in iomp5Deps:
+            commands.append(["install_name_tool", "-change", "libiomp5.dylib",
+                             patchedPicoPath + "/libiomp5.dylib",
+                             scratchPath + "/" + libraryToPatch])
+
+        # Finally, patch the driver libraries to look in the patched
+        # directory.
+        for driverLibrary in Path(scratchPath).glob("libps*.dylib"):
+            commands.append(["install_name_tool", "-add_rpath",
+                             patchedPicoPath, str(driverLibrary)])
+
+        processes = [subprocess.Popen(command) for command in commands]
+        returncodes = [process.wait() for process in processes]
+        for command, returncode in zip(commands, returncodes):
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, command)
+
+        try:
+            os.rename(scratchPath, patchedPicoPath.rstrip("/"))
+        except OSError:
+            # Another process finished patching first
+            if not Path(patchedPicoPath).is_dir():
+                raise
+    finally:
+        shutil.rmtree(scratchDir, ignore_errors=True)
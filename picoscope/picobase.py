@@ -17,12 +17,27 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import inspect
+import bisect
+import sys
 import time
 
+from fractions import Fraction
+
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from .error_codes import ERROR_CODES as _ERROR_CODES
+from .error_codes import ERROR_INFO as _ERROR_INFO
+
+# time.monotonic does not exist in Python 2
+_monotonic = getattr(time, "monotonic", time.time)
+
+# Driver libraries loaded so far, keyed by file name, see _loadLibrary
+_LIBRARIES = {}
 
 
 """
@@ -58,6 +73,53 @@ http://www.picotech.com/support/topic4926.html
 """
 
 
+def _toInt(value, table):
+    """Return `value` if it is already an API integer, else look it up."""
+    if isinstance(value, int):
+        return value
+    return table[value]
+
+
+def _scaleRaw(dataRaw, a2v, offset, dataV):
+    """Store ``dataRaw * a2v - offset`` in `dataV`."""
+    # Ask for the loop of the output type explicitly, so that the int16
+    # input is never promoted to a float64 temporary first.
+    np.multiply(dataRaw, a2v, dataV, dtype=dataV.dtype)
+    if offset != 0:
+        np.subtract(dataV, offset, dataV, dtype=dataV.dtype)
+
+
+if numba is not None:
+    # Numba's parallel=True threading layers can abort or hang the process
+    # when called from several Python threads. Instead, the kernel releases
+    # the GIL so that e.g. several channels can be converted in parallel
+    # threads, as numpy ufuncs allow for large arrays.
+    # The signatures are given explicitly so that the kernel is compiled (or
+    # loaded from the cache) on import rather than on the first capture.
+    @numba.njit(["void(int16[::1], float32, float32, float32[::1])",
+                 "void(int16[::1], float64, float64, float64[::1])"],
+                fastmath=True, cache=True, nogil=True)
+    def _scaleRawNumba(dataRaw, a2v, offset, dataV):
+        """Single pass version of _scaleRaw for 1D arrays."""
+        for i in range(dataRaw.size):
+            dataV[i] = dataRaw[i] * a2v - offset
+
+    @numba.njit(["void(float32[:], float64, float64, float64, int64, int64,"
+                 " int16[::1])",
+                 "void(float64[:], float64, float64, float64, int64, int64,"
+                 " int16[::1])"],
+                cache=True, nogil=True)
+    def _quantizeAWGNumba(waveform, offset, scale, shift, minVal, maxVal,
+                          out):
+        """Single pass version of the AWG quantization for 1D arrays."""
+        for i in range(waveform.size):
+            value = np.rint((waveform[i] - offset) * scale + shift)
+            out[i] = min(max(value, minVal), maxVal)
+else:
+    _scaleRawNumba = None
+    _quantizeAWGNumba = None
+
+
 class _PicoscopeBase(object):
     """
     This class defines a general interface for Picoscope oscilloscopes.
@@ -110,6 +172,14 @@ class _PicoscopeBase(object):
 
     ERROR_CODES = _ERROR_CODES
 
+    # changePowerSource parameter types. These are in fact just the error
+    # codes; Picoscope should have made them a separate enumerate.
+    POWER_STATES = {"PICO_POWER_SUPPLY_CONNECTED": 0x119,
+                    "PICO_POWER_SUPPLY_NOT_CONNECTED": 0x11A,
+                    "PICO_POWER_SUPPLY_REQUEST_INVALID": 0x11B,
+                    "PICO_POWER_SUPPLY_UNDERVOLTAGE": 0x11C,
+                    "PICO_USB3_0_DEVICE_NON_USB3_0_PORT": 0x11E}
+
     # For some reason this isn't working with me :S
     THRESHOLD_TYPE = {"Above": 0,
                       "Below": 1,
@@ -117,6 +187,11 @@ class _PicoscopeBase(object):
                       "Falling": 3,
                       "RiseOrFall": 4}
 
+    AWG_INDEX_MODES = {"Single": 0, "Dual": 1, "Quad": 2}
+
+    # Number of samples rawToV converts at a time
+    _RAW_TO_V_BLOCK = 2 ** 15
+
     # getUnitInfo parameter types
     UNIT_INFO_TYPES = {"DriverVersion": 0x0,
                        "USBVersion": 0x1,
@@ -146,23 +221,100 @@ class _PicoscopeBase(object):
         # that way the settings will make more sense
 
         # These do not correspond to API values, but rather to
-        # the "true" voltage as seen at the oscilloscope probe
+        # the "true" voltage as seen at the oscilloscope probe.
         self.CHRange = [5.0] * self.NUM_CHANNELS
         self.CHOffset = [0.0] * self.NUM_CHANNELS
         self.CHCoupling = [1] * self.NUM_CHANNELS
         self.ProbeAttenuation = [1.0] * self.NUM_CHANNELS
 
+        # Array copy of CHOffset, so that several channels can be scaled at
+        # once, see rawToVMulti. Kept up to date by setChannel.
+        self._offsets = np.array(self.CHOffset)
+        # Volts per ADC count of each channel, see _updateScales
+        self._updateScales()
+
+        # CHANNEL_RANGE split into parallel tuples, plus indices into them
+        # so that exact ranges skip the scan in setChannel.
+        self._range_v = tuple(item["rangeV"] for item in self.CHANNEL_RANGE)
+        self._range_api = tuple(
+            item["apivalue"] for item in self.CHANNEL_RANGE)
+        self._range_str = tuple(
+            item["rangeStr"] for item in self.CHANNEL_RANGE)
+        self._range_sorted_index = tuple(
+            sorted(range(len(self._range_v)), key=self._range_v.__getitem__))
+        self._range_sorted_v = tuple(
+            self._range_v[i] for i in self._range_sorted_index)
+        self._range_index_by_v = dict(
+            (v, i) for i, v in enumerate(self._range_v))
+        self._range_index_by_str = dict(
+            (rangeStr, i) for i, rangeStr in enumerate(self._range_str))
+        self._range_err = ", ".join(
+            "'%s'" % rangeStr for rangeStr in self._range_str)
+
+        # Number of passes through the AWG buffer per waveform, keyed by
+        # AWG_INDEX_MODES value
+        self._awg_passes = {self.AWG_INDEX_MODES["Single"]: 1,
+                            self.AWG_INDEX_MODES["Dual"]: 2,
+                            self.AWG_INDEX_MODES["Quad"]: 4}
+
+        # UNIT_INFO_TYPES names in API order, each with its padded label,
+        # for getAllUnitInfo
+        self._unit_info_keys = tuple(
+            (key, key.ljust(30) + ": ") for key in
+            sorted(self.UNIT_INFO_TYPES, key=self.UNIT_INFO_TYPES.get))
+
+        # (name, description) of each error code, for checkResult. Scopes
+        # using the common table share the mapping built on import.
+        if self.ERROR_CODES is _ERROR_CODES:
+            self._error_info = _ERROR_INFO
+        else:
+            self._error_info = dict(
+                (code, (name, desc))
+                for (code, name, desc) in self.ERROR_CODES)
+
         self.handle = None
 
+        # Results of _lowLevelGetTimebase, keyed by
+        # (timebase, noSamples, oversample, segmentIndex).
+        # Anything that changes the valid timebases must clear this, and
+        # the intervals cache below, with _clearTimebaseCache.
+        self._timebase_cache = {}
+        # Sample interval of every timebase, for the drivers that have to
+        # query them one at a time (ps2000, ps3000).
+        self._timebaseIntervalsCache = None
+
+        # (array, downSampleMode) left registered with the driver by
+        # getDataRaw(keepBuffer=True), keyed by (channel, segmentIndex).
+        self._boundBuffers = {}
+        # arrays created by getDataRaw(data=None, keepBuffer=True)
+        self._captureBuffers = {}
+        # raw data buffer reused by all captures, see preallocate
+        self._preallocated = None
+        # last autoscaled AWG waveform, see setAWGSimpleDeltaPhase
+        self._awg_cache = None
+
         if connect is True:
             self.open(serialNumber)
 
     def getUnitInfo(self, info):
         """Return a string containing information about `info`."""
-        if not isinstance(info, int):
-            info = self.UNIT_INFO_TYPES[info]
+        info = _toInt(info, self.UNIT_INFO_TYPES)
         return self._lowLevelGetUnitInfo(info)
 
+    @staticmethod
+    def _loadLibrary(loader, fileName):
+        """
+        Return the driver library `fileName`, loaded with `loader`.
+
+        The library is only searched for and loaded by the first scope that
+        uses it; every later scope shares the same library object.
+        """
+        lib = _LIBRARIES.get(fileName)
+        if lib is None:
+            lib = loader(fileName)
+            _LIBRARIES[fileName] = lib
+        return lib
+
     def getMaxValue(self):
         """Return the maximum ADC value, used for scaling."""
         # TODO: make this more consistent accross versions
@@ -173,15 +325,36 @@ class _PicoscopeBase(object):
         """Return the minimum ADC value, used for scaling."""
         return self.MIN_VALUE
 
+    def _updateScales(self):
+        """
+        Recompute the volts per ADC count of all channels.
+
+        Call this whenever the maximum ADC value may have changed, e.g. after
+        opening the scope or changing its resolution.
+        """
+        self._max_value = float(self.getMaxValue())
+        self._a2v = np.array(self.CHRange) / self._max_value
+
+        # Some drivers only know their AWG buffer size once opened, so the
+        # DDS scales of getAWGDeltaPhase and getAWGTimeIncrement are
+        # refreshed here as well.
+        if hasattr(self, "AWGBufferAddressWidth"):
+            self._awg_phase_scale = 2.0 ** (self.AWGPhaseAccumulatorSize -
+                                            self.AWGBufferAddressWidth)
+            self._awg_time_scale = self._awg_phase_scale / self.AWGDACFrequency
+            # getAWGDeltaPhaseExact needs the DAC rate as a rational number.
+            # Some drivers give the DAC interval as a decimal, others the
+            # frequency, with the other one computed from it as a float.
+            # The decimal one has the shorter rational representation.
+            self._awg_dac_frequency = min(
+                (1 / Fraction(str(self.AWGDACInterval)),
+                 Fraction(str(self.AWGDACFrequency))),
+                key=lambda frequency: frequency.denominator)
+
     def getAllUnitInfo(self):
         """Return a string containing all information of the device."""
-        s = ""
-        for key in sorted(self.UNIT_INFO_TYPES.keys(),
-                          key=self.UNIT_INFO_TYPES.get):
-            s += key.ljust(30) + ": " + self.getUnitInfo(key) + "\n"
-
-        s = s[:-1]
-        return s
+        return "\n".join(label + self.getUnitInfo(key)
+                         for key, label in self._unit_info_keys)
 
     def setChannel(self, channel='A', coupling="AC", VRange=2.0,
                    VOffset=0.0, enabled=True, BWLimited=0,
@@ -199,7 +372,8 @@ class _PicoscopeBase(object):
             of data returned via getData* may be inaccurate.
             See https://www.picotech.com/support/topic35401.html
         VRange
-            Measurement range in V.
+            Measurement range in V, or one of the `rangeStr` values of
+            CHANNEL_RANGE such as '2 V' or '50 mV'.
         VOffset
              An offset, in volts, to be added to the input signal before it
              reaches the input amplifier and digitizer.
@@ -251,36 +425,34 @@ class _PicoscopeBase(object):
         else:
             enabled = 0
 
-        if not isinstance(channel, int):
-            chNum = self.CHANNELS[channel]
-        else:
-            chNum = channel
+        chNum = _toInt(channel, self.CHANNELS)
 
-        if not isinstance(coupling, int):
-            coupling = self.CHANNEL_COUPLINGS[coupling]
+        coupling = _toInt(coupling, self.CHANNEL_COUPLINGS)
+
+        if isinstance(VRange, str):
+            rangeIndex = self._range_index_by_str.get(VRange)
+            if rangeIndex is None:
+                raise ValueError("Unknown range '%s'. Valid ranges are %s." %
+                                 (VRange, self._range_err))
+        else:
+            rangeIndex = self._range_index_by_v.get(VRange / probeAttenuation)
 
         # finds the next largest range
-        VRangeAPI = None
-        for item in self.CHANNEL_RANGE:
-            if item["rangeV"] - VRange / probeAttenuation > -1E-4:
-                if VRangeAPI is None:
-                    VRangeAPI = item
-                    # break
-                # Don't know if this is necessary assuming that it will iterate
-                # in order
-                elif VRangeAPI["rangeV"] > item["rangeV"]:
-                    VRangeAPI = item
-
-        if VRangeAPI is None:
-            raise ValueError(
-                "Desired range %f is too large. Maximum range is %f." %
-                (VRange, self.CHANNEL_RANGE[-1]["rangeV"] * probeAttenuation))
+        if rangeIndex is None:
+            i = bisect.bisect_right(self._range_sorted_v,
+                                    VRange / probeAttenuation - 1E-4)
+            if i == len(self._range_sorted_v):
+                raise ValueError(
+                    "Desired range %f is too large. Maximum range is %f." %
+                    (VRange, self._range_sorted_v[-1] * probeAttenuation))
+            rangeIndex = self._range_sorted_index[i]
+
+        VRangeAPI = self._range_api[rangeIndex]
 
         # store the actually chosen range of the scope
-        VRange = VRangeAPI["rangeV"] * probeAttenuation
+        VRange = self._range_v[rangeIndex] * probeAttenuation
 
-        if not isinstance(BWLimited, int):
-            BWLimited = self.BW_LIMITS[BWLimited]
+        BWLimited = _toInt(BWLimited, self.BW_LIMITS)
 
         if BWLimited == 3:
             BWLimited = 3  # 1MHz Bandwidth Limiter for PicoScope 4444
@@ -293,15 +465,24 @@ class _PicoscopeBase(object):
         else:
             BWLimited = 0
 
+        # buffers kept by getDataRaw(keepBuffer=True) are registered for the
+        # old channel setup
+        self.releaseBuffers()
+
         self._lowLevelSetChannel(chNum, enabled, coupling,
-                                 VRangeAPI["apivalue"],
+                                 VRangeAPI,
                                  VOffset / probeAttenuation, BWLimited)
 
+        # enabling/disabling channels changes the available memory
+        self._clearTimebaseCache()
+
         # if all was successful, save the parameters
         self.CHRange[chNum] = VRange
         self.CHOffset[chNum] = VOffset
         self.CHCoupling[chNum] = coupling
         self.ProbeAttenuation[chNum] = probeAttenuation
+        self._offsets[chNum] = VOffset
+        self._a2v[chNum] = VRange / self._max_value
 
         return VRange
 
@@ -323,8 +504,9 @@ class _PicoscopeBase(object):
         # 1GS buffer means it will take so long
         nSamples = min(self.noSamples, self.maxSamples)
 
-        # to return the same No. Samples ( if pretrig != 0.0 ) I'm wrong ?
-        nSamples_pretrig = int(round(nSamples * pretrig))
+        # Only the pre-trigger count is rounded, so that the pre and post
+        # trigger counts always add up to nSamples.
+        nSamples_pretrig = int(nSamples * pretrig + 0.5)
         self._lowLevelRunBlock(nSamples_pretrig,
                                nSamples - nSamples_pretrig,
                                self.timebase, self.oversample, segmentIndex,
@@ -334,10 +516,24 @@ class _PicoscopeBase(object):
         """Return whether scope is ready to transfer data."""
         return self._lowLevelIsReady()
 
-    def waitReady(self, spin_delay=0.01):
-        """Block until the scope is ready, retesting every `spin_delay` s."""
-        while not self.isReady():
-            time.sleep(spin_delay)
+    def waitReady(self, spin_delay=0.01, timeout=None):
+        """
+        Block until the scope is ready.
+
+        The scope is polled quickly at first, so that short captures are
+        picked up without delay, then the interval between polls doubles
+        up to `spin_delay` seconds.
+
+        If the scope is not ready after `timeout` seconds, raise an IOError.
+        """
+        if timeout is not None:
+            deadline = _monotonic() + timeout
+        delay = min(1E-4, spin_delay)
+        while not self._lowLevelIsReady():
+            if timeout is not None and _monotonic() >= deadline:
+                raise IOError("Timed out waiting for the scope to be ready")
+            time.sleep(delay)
+            delay = min(delay * 2, spin_delay)
 
     def setSamplingInterval(self, sampleInterval, duration, oversample=0,
                             segmentIndex=0):
@@ -370,15 +566,25 @@ class _PicoscopeBase(object):
 
         timebase_dt = self.getTimestepFromTimebase(self.timebase)
 
-        noSamples = int(round(duration / timebase_dt))
+        noSamples = int(duration / timebase_dt + 0.5)
 
-        (self.sampleInterval, self.maxSamples) = self._lowLevelGetTimebase(
-            self.timebase, noSamples, oversample, segmentIndex)
+        key = (self.timebase, noSamples, oversample, segmentIndex)
+        timebaseInfo = self._timebase_cache.get(key)
+        if timebaseInfo is None:
+            timebaseInfo = self._lowLevelGetTimebase(
+                self.timebase, noSamples, oversample, segmentIndex)
+            self._timebase_cache[key] = timebaseInfo
+        (self.sampleInterval, self.maxSamples) = timebaseInfo
 
         self.noSamples = noSamples
         self.sampleRate = 1.0 / self.sampleInterval
         return (self.sampleInterval, self.noSamples, self.maxSamples)
 
+    def _clearTimebaseCache(self):
+        """Forget all cached timebase queries."""
+        self._timebase_cache.clear()
+        self._timebaseIntervalsCache = None
+
     def setSamplingFrequency(self, sampleFrequency, noSamples, oversample=0,
                              segmentIndex=0):
         """
@@ -434,7 +640,10 @@ class _PicoscopeBase(object):
         Returns
             Number of samples in the segment.
         """
+        # the segments the kept buffers are registered for go away
+        self.releaseBuffers()
         maxSamples = self._lowLevelMemorySegments(noSegments)
+        self._clearTimebaseCache()
         self.maxSamples = maxSamples
         self.noSegments = noSegments
         return self.maxSamples
@@ -453,16 +662,17 @@ class _PicoscopeBase(object):
         This is only implemented for PS4000 series devices where
         the only acceptable values for VRange are 0.5 or 5.0.
         """
-        VRangeAPI = None
-        for item in self.CHANNEL_RANGE:
-            if np.isclose(item["rangeV"], VRange):
-                VRangeAPI = item
-                break
-
-        if VRangeAPI is None:
-            raise ValueError('Provided VRange is not valid')
+        rangeIndex = self._range_index_by_v.get(VRange)
+        if rangeIndex is None:
+            # Same tolerance as np.isclose, without the array round trip
+            for i, rangeV in enumerate(self._range_v):
+                if abs(rangeV - VRange) <= 1e-8 + 1e-5 * abs(VRange):
+                    rangeIndex = i
+                    break
+            else:
+                raise ValueError('Provided VRange is not valid')
 
-        self._lowLevelSetExtTriggerRange(VRangeAPI["apivalue"])
+        self._lowLevelSetExtTriggerRange(self._range_api[rangeIndex])
 
     def setSimpleTrigger(self, trigSrc, threshold_V=0, direction="Rising",
                          delay=0, timeout_ms=100, enabled=True):
@@ -495,23 +705,22 @@ class _PicoscopeBase(object):
         - Support for offset is currently untested.
         - The AUX port (or EXT) only has a range of +- 1V (at least in PS6000).
         """
-        if not isinstance(trigSrc, int):
-            trigSrc = self.CHANNELS[trigSrc]
+        trigSrc = _toInt(trigSrc, self.CHANNELS)
 
-        if not isinstance(direction, int):
-            direction = self.THRESHOLD_TYPE[direction]
+        direction = _toInt(direction, self.THRESHOLD_TYPE)
 
         if trigSrc >= self.NUM_CHANNELS:
-            threshold_adc = int((threshold_V / self.EXT_RANGE_VOLTS) *
-                                self.EXT_MAX_VALUE)
+            threshold_adc = int(round((threshold_V / self.EXT_RANGE_VOLTS) *
+                                      self.EXT_MAX_VALUE))
 
             # The external port is typically used as a clock. So I don't think
             # we should raise errors
             threshold_adc = min(threshold_adc, self.EXT_MAX_VALUE)
             threshold_adc = max(threshold_adc, self.EXT_MIN_VALUE)
         else:
-            a2v = self.CHRange[trigSrc] / self.getMaxValue()
-            threshold_adc = int((threshold_V + self.CHOffset[trigSrc]) / a2v)
+            a2v = self._a2v[trigSrc]
+            threshold_adc = int(round(
+                (threshold_V + self.CHOffset[trigSrc]) / a2v))
 
             if (threshold_adc > self.getMaxValue() or
                threshold_adc < self.getMinValue()):
@@ -567,12 +776,11 @@ class _PicoscopeBase(object):
 
         Returns a dictionary with keys 'scale' and 'offset'.
         """
-        if not isinstance(channel, int):
-            channel = self.CHANNELS[channel]
-        return {'scale': self.CHRange[channel] / float(self.getMaxValue()),
+        channel = _toInt(channel, self.CHANNELS)
+        return {'scale': self._a2v[channel],
                 'offset': self.CHOffset[channel]}
 
-    def rawToV(self, channel, dataRaw, dataV=None, dtype=np.float64):
+    def rawToV(self, channel, dataRaw, dataV=None, dtype=np.float32):
         """
         Convert the raw data to voltage units.
 
@@ -585,28 +793,84 @@ class _PicoscopeBase(object):
         dataV
             Numpy array to fill with the data. If None, create an empty one.
         dtype
-            Datatype for the numpy array to create.
+            Datatype for the numpy array to create. float32 has ample
+            precision for 16 bit ADC data and needs half the memory of
+            float64.
 
         Return
         ------
         Numpy array with the measurement in V.
         """
-        if not isinstance(channel, int):
-            channel = self.CHANNELS[channel]
+        channel = _toInt(channel, self.CHANNELS)
 
         if dataV is None:
             dataV = np.empty(dataRaw.shape, dtype=dtype)
 
-        a2v = self.CHRange[channel] / dtype(self.getMaxValue())
-        np.multiply(dataRaw, a2v, dataV)
-        np.subtract(dataV, self.CHOffset[channel], dataV)
+        # Cast the scalars so that numpy and numba compute in the precision
+        # of dataV instead of promoting to float64
+        scalar = dataV.dtype.type
+        a2v = scalar(self._a2v[channel])
+        offset = scalar(self.CHOffset[channel])
+
+        if (dataRaw.shape != dataV.shape or
+                not dataRaw.flags.c_contiguous or
+                not dataV.flags.c_contiguous):
+            _scaleRaw(dataRaw, a2v, offset, dataV)
+            return dataV
+
+        raw = dataRaw.reshape(-1)
+        volts = dataV.reshape(-1)
+
+        if (_scaleRawNumba is not None and raw.dtype == np.int16 and
+                volts.dtype in (np.float32, np.float64)):
+            _scaleRawNumba(raw, a2v, offset, volts)
+            return dataV
+
+        # Convert in blocks small enough to stay in cache, so that the
+        # subtraction reads back what the multiplication just wrote instead
+        # of making a second pass over main memory.
+        for start in range(0, raw.size, self._RAW_TO_V_BLOCK):
+            block = slice(start, start + self._RAW_TO_V_BLOCK)
+            _scaleRaw(raw[block], a2v, offset, volts[block])
 
         return dataV
 
+    def rawToVMulti(self, channels, dataRaw, dataV=None, dtype=np.float32):
+        """
+        Convert the raw data of several channels to voltage units at once.
+
+        Parameters
+        ----------
+        channels
+            Sequence of scope channel numbers or names.
+        dataRaw
+            Raw data, with one row per entry of `channels`.
+        dataV
+            Numpy array to fill with the data. If None, create an empty one.
+        dtype
+            Datatype for the numpy array to create. See rawToV.
+
+        Return
+        ------
+        Numpy array with the measurement in V, one row per channel.
+        """
+        channels = [_toInt(channel, self.CHANNELS) for channel in channels]
+
+        if dataV is None:
+            dataV = np.empty(dataRaw.shape, dtype=dtype)
+
+        # Column vectors, so that each row is scaled by its own channel
+        a2v = self._a2v[channels, None].astype(dataV.dtype)
+        offset = self._offsets[channels, None].astype(dataV.dtype)
+
+        np.multiply(dataRaw, a2v, dataV, dtype=dataV.dtype)
+        np.subtract(dataV, offset, dataV, dtype=dataV.dtype)
+        return dataV
+
     def getDataV(self, channel, numSamples=0, startIndex=0, downSampleRatio=1,
                  downSampleMode=0, segmentIndex=0, returnOverflow=False,
                  exceptOverflow=False, dataV=None, dataRaw=None,
-                 dtype=np.float64):
+                 dtype=np.float32, keepBuffer=False, fillTail=True):
         """
         Return the data of a single channel as an array of voltage values.
 
@@ -634,10 +898,18 @@ class _PicoscopeBase(object):
             Raise an IOError exception on overflow.
         dataV
             Numpy array to fill with the data. If None, create an empty one.
+            It must hold at least `numSamples` values; samples that were not
+            returned by the scope are set to NaN, unless fillTail is False.
         dtype
-            Datatype for the numpy array to create.
+            Datatype for the numpy array to create. See rawToV.
         dataRaw
-            Not used
+            Numpy int16 array the raw data is transferred into.
+            If None, create an empty one. See getDataRaw.
+        keepBuffer
+            Leave `dataRaw` registered with the driver. See getDataRaw.
+        fillTail
+            Set the part of `dataV` past the returned samples to NaN. If
+            False, it keeps whatever it held before.
 
         Return
         -----
@@ -645,17 +917,34 @@ class _PicoscopeBase(object):
             Numpy array with the values in Volts.
         overflow : bool, only if returnOverflow is True
             Whether the measured value exceeded the measurement range.
+
+        Notes
+        -----
+        When capturing many waveforms in a loop, pass rows of preallocated
+        arrays as `dataV` and `dataRaw`, similarly to how the C API takes
+        pointers to user buffers. No memory is then allocated per capture::
+
+            volts = np.empty((nCaptures, nSamples), dtype=np.float32)
+            raw = np.empty(nSamples, dtype=np.int16)
+            for i in range(nCaptures):
+                ps.runBlock()
+                ps.waitReady()
+                ps.getDataV('A', nSamples, dataV=volts[i], dataRaw=raw,
+                            keepBuffer=True)
+            ps.releaseBuffers()
         """
         (dataRaw, numSamplesReturned, overflow) = self.getDataRaw(
             channel, numSamples, startIndex, downSampleRatio, downSampleMode,
-            segmentIndex, dataRaw)
+            segmentIndex, dataRaw, keepBuffer)
 
         if dataV is None:
-            dataV = self.rawToV(channel, dataRaw, dtype=dtype)
-            dataV = dataV[:numSamplesReturned]
+            dataV = self.rawToV(channel, dataRaw[:numSamplesReturned],
+                                dtype=dtype)
         else:
-            self.rawToV(channel, dataRaw, dataV, dtype=dtype)
-            dataV[numSamplesReturned:] = np.nan
+            self.rawToV(channel, dataRaw[:numSamplesReturned],
+                        dataV[:numSamplesReturned], dtype=dataV.dtype.type)
+            if fillTail:
+                dataV[numSamplesReturned:] = np.nan
 
         if returnOverflow:
             return (dataV, overflow)
@@ -664,9 +953,68 @@ class _PicoscopeBase(object):
                 raise IOError("Overflow detected in data")
             return dataV
 
+    def getDataVMulti(self, channels, numSamples=0, startIndex=0,
+                      downSampleRatio=1, downSampleMode=0, segmentIndex=0,
+                      returnOverflow=False, exceptOverflow=False, dataV=None,
+                      dtype=np.float32, fillTail=True):
+        """
+        Return the data of several channels as an array of voltage values.
+
+        The raw data of all channels is transferred into one 2D array, which
+        is then converted in a single call to rawToVMulti.
+
+        Parameters
+        ----------
+        channels
+            Sequence of scope channel numbers or names.
+        dataV
+            Numpy array to fill with the data, with one row per channel.
+            If None, create an empty one. Samples that were not returned by
+            the scope are set to NaN, unless fillTail is False.
+
+        See getDataV for the other parameters.
+
+        Return
+        -----
+        dataV : numpy array
+            Numpy array with the values in Volts, one row per channel.
+        overflow : list of bool, only if returnOverflow is True
+            Whether the measured value exceeded the measurement range, per
+            channel.
+        """
+        if numSamples == 0:
+            numSamples = min(self.maxSamples, self.noSamples)
+
+        dataRaw = self._newRawBuffer(numSamples, len(channels))
+        numSamplesReturned = numSamples
+        overflow = []
+        for channel, row in zip(channels, dataRaw):
+            (_, returned, chOverflow) = self.getDataRaw(
+                channel, numSamples, startIndex, downSampleRatio,
+                downSampleMode, segmentIndex, row)
+            numSamplesReturned = min(numSamplesReturned, returned)
+            overflow.append(chOverflow)
+
+        if dataV is None:
+            dataV = self.rawToVMulti(channels,
+                                     dataRaw[:, :numSamplesReturned],
+                                     dtype=dtype)
+        else:
+            self.rawToVMulti(channels, dataRaw[:, :numSamplesReturned],
+                             dataV[:, :numSamplesReturned])
+            if fillTail:
+                dataV[:, numSamplesReturned:] = np.nan
+
+        if returnOverflow:
+            return (dataV, overflow)
+        else:
+            if any(overflow) and exceptOverflow:
+                raise IOError("Overflow detected in data")
+            return dataV
+
     def getDataRaw(self, channel='A', numSamples=0, startIndex=0,
                    downSampleRatio=1, downSampleMode=0, segmentIndex=0,
-                   data=None):
+                   data=None, keepBuffer=False):
         """
         Return the data of a single channel.
 
@@ -689,6 +1037,14 @@ class _PicoscopeBase(object):
             Index of the memory segment to get data from.
         data
             Numpy array to fill with the data. If None, create an empty one.
+        keepBuffer
+            Leave `data` registered with the driver after the transfer, so
+            that the next call with the same array, channel and segment does
+            not have to register it again. Until releaseBuffers() is called,
+            every transfer of captured data also writes into this array.
+            setChannel and memorySegments release the array as well.
+            If `data` is None, the array created by the first call is reused
+            by the following ones, and is overwritten by each of them.
 
         Return
         ------
@@ -699,15 +1055,24 @@ class _PicoscopeBase(object):
         overflow : bool
             Whether the measured value exceeded the measurement range.
         """
-        if not isinstance(channel, int):
-            channel = self.CHANNELS[channel]
+        channel = _toInt(channel, self.CHANNELS)
 
         if numSamples == 0:
             # maxSamples is probably huge, 1Gig Sample can be HUGE....
             numSamples = min(self.maxSamples, self.noSamples)
 
         if data is None:
-            data = np.empty(numSamples, dtype=np.int16)
+            # With keepBuffer, the array allocated for this channel and
+            # segment stays registered and is reused by the next capture.
+            # Such arrays get their own memory rather than a view of the
+            # preallocate() buffer, which every channel would share.
+            if keepBuffer:
+                data = self._captureBuffers.get((channel, segmentIndex))
+                if data is None or data.size != numSamples:
+                    data = self._allocAligned(numSamples)
+                    self._captureBuffers[(channel, segmentIndex)] = data
+            else:
+                data = self._newRawBuffer(numSamples)
         else:
 
             if data.dtype != np.int16:
@@ -716,25 +1081,143 @@ class _PicoscopeBase(object):
                 raise ValueError(
                     'Provided array must be at least as big as numSamples.')
             # see numpy.ndarray.flags
-            if data.flags['CARRAY'] is False:
+            if not data.flags.carray:
                 raise TypeError('Provided array must be c_contiguous,' +
                                 ' aligned and writeable.')
 
-        self._lowLevelSetDataBuffer(channel, data, downSampleMode,
-                                    segmentIndex)
+        bound = self._boundBuffers.get((channel, segmentIndex))
+        if (bound is None or bound[0] is not data or
+                bound[1] != downSampleMode):
+            self._setDataBuffer(channel, data, downSampleMode, segmentIndex)
 
         (numSamplesReturned, overflow) = self._lowLevelGetValues(
             numSamples, startIndex, downSampleRatio, downSampleMode,
             segmentIndex)
-        # necessary or else the next call to getValues will try to fill
-        # this array unless it is a call trying to read the same channel.
-        self._lowLevelClearDataBuffer(channel, segmentIndex)
+
+        if not keepBuffer:
+            # necessary or else the next call to getValues will try to fill
+            # this array unless it is a call trying to read the same channel.
+            self._clearDataBuffer(channel, segmentIndex)
 
         # overflow is a bitwise mask
         overflow = bool(overflow & (1 << channel))
 
         return (data, numSamplesReturned, overflow)
 
+    def preallocate(self, numSamples, numSegments=1):
+        """
+        Allocate a raw data buffer to be reused by every capture.
+
+        From then on, getDataRaw and getDataRawBulk return views of this
+        buffer when they are not given an array, instead of allocating a new
+        one per call. Each call therefore overwrites the data returned by
+        the previous one: copy it, or convert it with getDataV, first.
+        Arrays that stay registered with the driver, see keepBuffer and
+        bindDataBuffer, are still allocated one per channel and segment.
+
+        Parameters
+        ----------
+        numSamples
+            Number of samples per segment. If 0, free the buffer again.
+        numSegments
+            Number of segments, for getDataRawBulk.
+        """
+        if numSamples == 0:
+            self._preallocated = None
+        else:
+            self._preallocated = self._allocAligned((numSegments, numSamples))
+
+    def _newRawBuffer(self, numSamples, numSegments=None):
+        """
+        Return an int16 array for getDataRaw (1D) or getDataRawBulk (2D).
+
+        The array is a view of the preallocate() buffer if it is big enough.
+        """
+        buf = self._preallocated
+        if (buf is not None and buf.shape[0] >= (numSegments or 1) and
+                buf.shape[1] >= numSamples):
+            if numSegments is None:
+                return buf[0, :numSamples]
+            return buf[:numSegments, :numSamples]
+        if numSegments is None:
+            return self._allocAligned(numSamples)
+        return self._allocAligned((numSegments, numSamples))
+
+    def bindDataBuffer(self, channel='A', data=None, segmentIndex=0,
+                       downSampleMode=0, numSamples=0):
+        """
+        Register an array with the driver ahead of a capture loop.
+
+        This does up front what the first getDataRaw(keepBuffer=True) call
+        would do, so that every getDataRaw call in the loop skips the
+        registration. Call getDataRaw with keepBuffer=True and the same
+        channel, segment and downSampleMode, and pass the same `data` or
+        None, to keep the array bound. releaseBuffers() unregisters it.
+
+        Parameters
+        ----------
+        channel
+            Scope channel number or name.
+        data
+            int16 numpy array to register. If None, create an empty one.
+        segmentIndex
+            Index of the memory segment the array is for.
+        downSampleMode
+            Method of downsampling the array is for.
+        numSamples
+            Size of the array to create if `data` is None. If 0, take the
+            calculated number from set sampling interval/frequency.
+
+        Return
+        ------
+        The registered array.
+        """
+        channel = _toInt(channel, self.CHANNELS)
+
+        if data is None:
+            if numSamples == 0:
+                numSamples = min(self.maxSamples, self.noSamples)
+            # not a view of the preallocate() buffer, see getDataRaw
+            data = self._allocAligned(numSamples)
+        elif data.dtype != np.int16 or not data.flags.carray:
+            raise TypeError('Provided array must be int16, c_contiguous,' +
+                            ' aligned and writeable.')
+
+        self._setDataBuffer(channel, data, downSampleMode, segmentIndex)
+        self._captureBuffers[(channel, segmentIndex)] = data
+        return data
+
+    def releaseBuffers(self):
+        """Unregister all arrays kept by getDataRaw(keepBuffer=True)."""
+        self._captureBuffers.clear()
+        for (channel, segmentIndex) in list(self._boundBuffers):
+            self._clearDataBuffer(channel, segmentIndex)
+
+    def _setDataBuffer(self, channel, data, downSampleMode, segmentIndex,
+                       bulk=False):
+        """
+        Register `data` with the driver and record it in _boundBuffers.
+
+        All registrations go through this method and _clearDataBuffer, so
+        that _boundBuffers always matches what the driver writes to. The
+        reference kept there also stops the array from being freed while the
+        driver still points to it.
+        """
+        if (channel, segmentIndex) in self._boundBuffers:
+            self._clearDataBuffer(channel, segmentIndex)
+        if bulk:
+            self._lowLevelSetDataBufferBulk(channel, data, segmentIndex,
+                                            downSampleMode)
+        else:
+            self._lowLevelSetDataBuffer(channel, data, downSampleMode,
+                                        segmentIndex)
+        self._boundBuffers[(channel, segmentIndex)] = (data, downSampleMode)
+
+    def _clearDataBuffer(self, channel, segmentIndex):
+        """Unregister the array of `channel` and `segmentIndex`."""
+        self._lowLevelClearDataBuffer(channel, segmentIndex)
+        self._boundBuffers.pop((channel, segmentIndex), None)
+
     def getDataRawBulk(self, channel='A', numSamples=0, fromSegment=0,
                        toSegment=None, downSampleRatio=1, downSampleMode=0,
                        data=None):
@@ -759,7 +1242,8 @@ class _PicoscopeBase(object):
         downSampleMode
             Method of downsampling.
         data
-            Numpy array to fill with the data. If None, create an empty one.
+            Numpy int16 array of shape (segments, numSamples) to fill with
+            the data, one row per segment. If None, create an empty one.
 
         Return
         ------
@@ -770,8 +1254,7 @@ class _PicoscopeBase(object):
         overflow : numpy array
             Array containing whether the range was exceeded.
         """
-        if not isinstance(channel, int):
-            channel = self.CHANNELS[channel]
+        channel = _toInt(channel, self.CHANNELS)
         if toSegment is None:
             toSegment = self.noSegments - 1
         if numSamples == 0:
@@ -779,28 +1262,219 @@ class _PicoscopeBase(object):
 
         numSegmentsToCopy = toSegment - fromSegment + 1
         if data is None:
-            data = np.ascontiguousarray(
-                np.zeros((numSegmentsToCopy, numSamples), dtype=np.int16))
+            # The driver writes every sample, so there is no point in
+            # zeroing the (possibly very large) array first.
+            data = self._newRawBuffer(numSamples, numSegmentsToCopy)
+        elif (data.ndim != 2 or data.shape[0] != numSegmentsToCopy or
+                data.shape[1] < numSamples):
+            raise ValueError(
+                'Provided array must have one row per segment, each at'
+                ' least as big as numSamples.')
 
         # set up each row in the data array as a buffer for one of
         # the memory segments in the scope
-        for i, segment in enumerate(range(fromSegment, toSegment + 1)):
-            self._lowLevelSetDataBufferBulk(channel,
-                                            data[i],
-                                            segment,
-                                            downSampleMode)
-        overflow = np.ascontiguousarray(
-            np.zeros(numSegmentsToCopy, dtype=np.int16))
+        segments = range(fromSegment, toSegment + 1)
+        for segment, row in zip(segments, data):
+            self._setDataBuffer(channel, row, downSampleMode, segment,
+                                bulk=True)
+        overflow = np.empty(numSegmentsToCopy, dtype=np.int16)
 
         self._lowLevelGetValuesBulk(numSamples, fromSegment, toSegment,
                                     downSampleRatio, downSampleMode, overflow)
 
         # don't leave the API thinking these can be written to later
-        for i, segment in enumerate(range(fromSegment, toSegment + 1)):
-            self._lowLevelClearDataBuffer(channel, segment)
+        for segment in segments:
+            self._clearDataBuffer(channel, segment)
 
         return (data, numSamples, overflow)
 
+    def getDataVBulk(self, channel='A', numSamples=0, fromSegment=0,
+                     toSegment=None, downSampleRatio=1, downSampleMode=0,
+                     dataV=None, dataRaw=None, dtype=np.float32):
+        """
+        Get one or more waveforms collected in rapid block mode in volts.
+
+        All segments are converted in a single call to rawToV.
+
+        Parameters
+        ----------
+        channel
+            Scope channel number or name.
+        numSamples
+            Number of samples per segment to return.
+            If 0, take the calculated number from set sampling interval.
+        fromSegment
+            Index of the first segment to retrieve data from.
+        toSegment
+            Index of the last segment to retrieve data from. If None: the last.
+        downSampleRatio
+            Downsampling factor that will be applied to the raw data. Multiple
+            downsampling modes can be bitwise-ORed together, but the
+            downSampleRatio must be the same for all modes.
+        downSampleMode
+            Method of downsampling.
+        dataV
+            Numpy array of shape (segments, numSamples) to fill with the
+            data. If None, create an empty one.
+        dataRaw
+            Numpy int16 array the raw data is transferred into.
+            If None, create an empty one. See getDataRawBulk.
+        dtype
+            Datatype for the numpy array to create. See rawToV.
+
+        Return
+        ------
+        dataV : numpy array
+            Array containing the data in Volts, one row per segment.
+        numSamples : int
+            Number of samples retrieved per waveform.
+        overflow : numpy array
+            Array containing whether the range was exceeded.
+        """
+        (dataRaw, numSamples, overflow) = self.getDataRawBulk(
+            channel, numSamples, fromSegment, toSegment, downSampleRatio,
+            downSampleMode, dataRaw)
+
+        dataV = self.rawToV(channel, dataRaw, dataV, dtype=dtype)
+
+        return (dataV, numSamples, overflow)
+
+    def captureBlocksV(self, channel, nCaptures, numSamples=0, pretrig=0.0,
+                       segmentIndex=0, dataV=None, dtype=np.float32):
+        """
+        Run `nCaptures` blocks and return the data of a channel in volts.
+
+        Each block is converted while the scope is already acquiring the
+        next one, so the conversion time is hidden behind the acquisition.
+        Must have already called setSampling for proper setup.
+
+        Parameters
+        ----------
+        channel
+            Scope channel number or name.
+        nCaptures
+            Number of blocks to capture, at least 1.
+        numSamples
+            Number of samples to return per block. If 0, take the calculated
+            number from set sampling interval/frequency.
+        pretrig
+            Fraction of samples before the trigger. See runBlock.
+        segmentIndex
+            Index of scope memory segment to save data to.
+        dataV
+            Numpy array of shape (nCaptures, numSamples) to fill with the
+            data. If None, create an empty one.
+        dtype
+            Datatype for the numpy array to create. See rawToV.
+
+        Return
+        ------
+        dataV : numpy array
+            Array containing the data in Volts, one row per block. Samples
+            that were not returned by the scope are set to NaN.
+        overflow : numpy array
+            Boolean array containing whether the range was exceeded.
+        """
+        if nCaptures < 1:
+            raise ValueError('nCaptures must be at least 1.')
+        if numSamples == 0:
+            numSamples = min(self.maxSamples, self.noSamples)
+        if dataV is None:
+            dataV = np.empty((nCaptures, numSamples), dtype=dtype)
+        overflow = np.empty(nCaptures, dtype=bool)
+
+        # The raw data of a block is converted before the next one is
+        # transferred, so a single buffer, left registered with the driver
+        # until the last transfer, is enough.
+        dataRaw = self._allocAligned(numSamples)
+
+        self.runBlock(pretrig, segmentIndex)
+        self.waitReady()
+        (_, numSamplesReturned, overflow[0]) = self.getDataRaw(
+            channel, numSamples, 0, 1, 0, segmentIndex, dataRaw,
+            keepBuffer=nCaptures > 1)
+
+        for i in range(nCaptures):
+            last = i + 1 == nCaptures
+            if not last:
+                self.runBlock(pretrig, segmentIndex)
+
+            self.rawToV(channel, dataRaw[:numSamplesReturned],
+                        dataV[i, :numSamplesReturned])
+            dataV[i, numSamplesReturned:] = np.nan
+
+            if not last:
+                self.waitReady()
+                (_, numSamplesReturned, overflow[i + 1]) = self.getDataRaw(
+                    channel, numSamples, 0, 1, 0, segmentIndex, dataRaw,
+                    keepBuffer=i + 2 < nCaptures)
+
+        return (dataV, overflow)
+
+    def iterDataRawBulk(self, channel, nRuns, numSamples=0, fromSegment=0,
+                        toSegment=None, pretrig=0.0, downSampleRatio=1,
+                        downSampleMode=0):
+        """
+        Run `nRuns` rapid block captures and yield the raw data of each.
+
+        The next run is started as soon as the previous one is transferred,
+        so the scope acquires while the caller processes the data. Two
+        buffers are used in turn: a yielded array is only overwritten once
+        the generator is resumed a second time.
+        Must have already called setSampling, memorySegments and
+        setNoOfCaptures for proper setup.
+
+        Parameters
+        ----------
+        channel
+            Scope channel number or name.
+        nRuns
+            Number of rapid block runs to capture.
+        numSamples, fromSegment, toSegment, downSampleRatio, downSampleMode
+            See getDataRawBulk.
+        pretrig
+            Fraction of samples before the trigger. See runBlock.
+
+        Yields
+        ------
+        data : numpy array
+            Array containing the raw data, one row per segment.
+        overflow : numpy array
+            Array containing whether the range was exceeded.
+        """
+        if toSegment is None:
+            toSegment = self.noSegments - 1
+        if numSamples == 0:
+            numSamples = min(self.maxSamples, self.noSamples)
+        shape = (toSegment - fromSegment + 1, numSamples)
+        buffers = [self._allocAligned(shape) for _ in range(min(nRuns, 2))]
+
+        # The drivers do not allow a transfer while another call is in
+        # progress on the same handle, so rather than reading in a thread,
+        # the overlap comes from re-arming the scope before yielding.
+        self.runBlock(pretrig, fromSegment)
+        for i in range(nRuns):
+            self.waitReady()
+            (data, _, overflow) = self.getDataRawBulk(
+                channel, numSamples, fromSegment, toSegment, downSampleRatio,
+                downSampleMode, buffers[i % 2])
+            if i + 1 < nRuns:
+                self.runBlock(pretrig, fromSegment)
+            yield (data, overflow)
+
+    def _allocAligned(self, shape, dtype=np.int16, align=4096):
+        """
+        Return an empty C contiguous array starting on an `align` boundary.
+
+        Page aligned buffers let the driver transfer straight into our memory.
+        The returned array is a view, and keeps the underlying block alive.
+        """
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        block = np.empty(nbytes + align, dtype=np.uint8)
+        offset = -block.ctypes.data % align
+        return block[offset:offset + nbytes].view(dtype).reshape(shape)
+
     def setSigGenBuiltInSimple(self,
                                offsetVoltage=0, pkToPk=2, waveType="Sine",
                                frequency=1E6, shots=1, triggerType="Rising",
@@ -845,14 +1519,10 @@ class _PicoscopeBase(object):
         if triggerSource is None:
             triggerSource = "None"
 
-        if not isinstance(waveType, int):
-            waveType = self.WAVE_TYPES[waveType]
-        if not isinstance(triggerType, int):
-            triggerType = self.SIGGEN_TRIGGER_TYPES[triggerType]
-        if not isinstance(triggerSource, int):
-            triggerSource = self.SIGGEN_TRIGGER_SOURCES[triggerSource]
-        if not isinstance(sweepType, int):
-            sweepType = self.SWEEP_TYPES[sweepType]
+        waveType = _toInt(waveType, self.WAVE_TYPES)
+        triggerType = _toInt(triggerType, self.SIGGEN_TRIGGER_TYPES)
+        triggerSource = _toInt(triggerSource, self.SIGGEN_TRIGGER_SOURCES)
+        sweepType = _toInt(sweepType, self.SWEEP_TYPES)
 
         self._lowLevelSetSigGenBuiltInSimple(
             offsetVoltage, pkToPk, waveType, frequency, shots, triggerType,
@@ -875,15 +1545,9 @@ class _PicoscopeBase(object):
         """
         sampling_interval = duration / len(waveform)
 
-        if not isinstance(indexMode, int):
-            indexMode = self.AWG_INDEX_MODES[indexMode]
+        indexMode = _toInt(indexMode, self.AWG_INDEX_MODES)
 
-        if indexMode == self.AWG_INDEX_MODES["Single"]:
-            pass
-        elif indexMode == self.AWG_INDEX_MODES["Dual"]:
-            sampling_interval /= 2
-        elif indexMode == self.AWG_INDEX_MODES["Quad"]:
-            sampling_interval /= 4
+        sampling_interval /= self._awg_passes.get(indexMode, 1)
 
         deltaPhase = self.getAWGDeltaPhase(sampling_interval)
 
@@ -896,7 +1560,7 @@ class _PicoscopeBase(object):
     def setAWGSimpleDeltaPhase(self, waveform, deltaPhase, offsetVoltage=None,
                                pkToPk=None, indexMode="Single", shots=1,
                                triggerType="Rising",
-                               triggerSource="ScopeTrig"):
+                               triggerSource="ScopeTrig", out=None):
         """
         Specify deltaPhase between each sample and not the total waveform
         duration.
@@ -952,6 +1616,10 @@ class _PicoscopeBase(object):
 
         To find the nearest power of 2
         math.pow(2, int(math.log(deltaPhase, 2), + 0.5))
+
+        When sweeping through different float waveforms of the same length,
+        pass a contiguous int16 array of that length as `out`, and the
+        quantized samples are written into it instead of a new array.
         """
         """
         This part of the code is written for the PS6403
@@ -967,12 +1635,9 @@ class _PicoscopeBase(object):
         I assume they have some type of adjustable gain and offset on their DDS
         allowing them to claim that they can get extremely high resolution.
         """
-        if not isinstance(indexMode, int):
-            indexMode = self.AWG_INDEX_MODES[indexMode]
-        if not isinstance(triggerType, int):
-            triggerType = self.SIGGEN_TRIGGER_TYPES[triggerType]
-        if not isinstance(triggerSource, int):
-            triggerSource = self.SIGGEN_TRIGGER_SOURCES[triggerSource]
+        indexMode = _toInt(indexMode, self.AWG_INDEX_MODES)
+        triggerType = _toInt(triggerType, self.SIGGEN_TRIGGER_TYPES)
+        triggerSource = _toInt(triggerSource, self.SIGGEN_TRIGGER_SOURCES)
 
         if waveform.dtype == np.int16:
             if offsetVoltage is None:
@@ -980,53 +1645,31 @@ class _PicoscopeBase(object):
             if pkToPk is None:
                 pkToPk = 2.0
                 # TODO: make this a per scope function assuming 2.0 V AWG
+            # The drivers read the samples straight from the array memory,
+            # so strided views have to be copied. This is free otherwise.
+            waveform = np.ascontiguousarray(waveform)
+        elif out is not None:
+            if out.dtype != np.int16 or not out.flags.carray:
+                raise TypeError('out must be an int16, c_contiguous,' +
+                                ' aligned and writeable array.')
+            if out.shape != waveform.shape:
+                raise ValueError('out must have the shape of waveform.')
+            (waveform, offsetVoltage, pkToPk) = self._quantizeAWGWaveform(
+                waveform, offsetVoltage, pkToPk, indexMode, out)
         else:
-            if indexMode == self.AWG_INDEX_MODES["Quad"]:
-                # Optimize for the Quad mode.
-                """
-                Quad mode. The generator outputs the contents of the buffer,
-                then on its second pass through the buffer outputs the same
-                data in reverse order. On the third and fourth passes
-                it does the same but with a negative version of the data. This
-                allows you to specify only the first quarter of a waveform with
-                fourfold symmetry, such as a sine wave, and let the generator
-                fill in the other three quarters.
-                """
-                if offsetVoltage is None:
-                    offsetVoltage = waveform[0]
+            # Swept measurements tend to upload the same waveform over and
+            # over, so reuse the last quantization when nothing changed.
+            key = (waveform.dtype, offsetVoltage, pkToPk, indexMode,
+                   self.AWGMinVal, self.AWGMaxVal)
+            cached = self._awg_cache
+            if (cached is not None and cached[0] == key and
+                    np.array_equal(cached[1], waveform)):
+                (waveform, offsetVoltage, pkToPk) = cached[2]
             else:
-                # Nothing to do for the dual mode or the single mode
-                if offsetVoltage is None:
-                    offsetVoltage = (np.max(waveform) + np.min(waveform)) / 2
-
-            # make a copy of the original data as to not clobber up the array
-            waveform = waveform - offsetVoltage
-            if pkToPk is None:
-                pkToPk = np.max(np.absolute(waveform)) * 2
-
-            # waveform should now be baised around 0
-            # with
-            #     max(waveform) = +pkToPk/2
-            #     min(waveform) = -pkToPk/2
-            waveform /= pkToPk
-
-            # waveform should now be a number between -0.5 and +0.5
-
-            waveform += 0.5
-            # and now the waveform is between 0 and 1
-            # inclusively???
-
-            # now the waveform is properly quantized
-            waveform *= (self.AWGMaxVal - self.AWGMinVal)
-            waveform += self.AWGMinVal
-
-            waveform.round(out=waveform)
-
-            # convert to an int16 typqe as requried by the function
-            waveform = np.array(waveform, dtype=np.int16)
-
-            # funny floating point rounding errors
-            waveform.clip(self.AWGMinVal, self.AWGMaxVal, out=waveform)
+                quantized = self._quantizeAWGWaveform(
+                    waveform, offsetVoltage, pkToPk, indexMode)
+                self._awg_cache = (key, waveform.copy(), quantized)
+                (waveform, offsetVoltage, pkToPk) = quantized
 
         self._lowLevelSetAWGSimpleDeltaPhase(
             waveform, deltaPhase, offsetVoltage, pkToPk, indexMode, shots,
@@ -1035,15 +1678,101 @@ class _PicoscopeBase(object):
         timeIncrement = self.getAWGTimeIncrement(deltaPhase)
         waveform_duration = timeIncrement * len(waveform)
 
-        if indexMode == self.AWG_INDEX_MODES["Single"]:
-            pass
-        elif indexMode == self.AWG_INDEX_MODES["Dual"]:
-            waveform_duration *= 2
-        elif indexMode == self.AWG_INDEX_MODES["Quad"]:
-            waveform_duration *= 4
+        waveform_duration *= self._awg_passes.get(indexMode, 1)
 
         return waveform_duration
 
+    def _quantizeAWGWaveform(self, waveform, offsetVoltage, pkToPk,
+                             indexMode, out=None):
+        """
+        Autoscale a waveform in volts onto the int16 AWG sample range.
+
+        If `out` is given, the samples are written into it.
+
+        Return
+        ------
+        waveform : numpy int16 array
+            Waveform to upload to the scope.
+        offsetVoltage : float
+            Offset voltage used for the scaling.
+        pkToPk : float
+            Peak to peak voltage used for the scaling.
+        """
+        # The extremes are all that is needed to autoscale, so find them
+        # once instead of scanning the waveform for each quantity.
+        if pkToPk is None or (
+                offsetVoltage is None and
+                indexMode != self.AWG_INDEX_MODES["Quad"]):
+            waveformMin = np.min(waveform)
+            waveformMax = np.max(waveform)
+
+        if indexMode == self.AWG_INDEX_MODES["Quad"]:
+            # Optimize for the Quad mode.
+            """
+            Quad mode. The generator outputs the contents of the buffer,
+            then on its second pass through the buffer outputs the same
+            data in reverse order. On the third and fourth passes
+            it does the same but with a negative version of the data. This
+            allows you to specify only the first quarter of a waveform with
+            fourfold symmetry, such as a sine wave, and let the generator
+            fill in the other three quarters.
+            """
+            if offsetVoltage is None:
+                offsetVoltage = waveform[0]
+        else:
+            # Nothing to do for the dual mode or the single mode
+            if offsetVoltage is None:
+                offsetVoltage = (waveformMax + waveformMin) / 2
+
+        if pkToPk is None:
+            pkToPk = max(waveformMax - offsetVoltage,
+                         offsetVoltage - waveformMin) * 2
+
+        # once the offset is removed, the waveform is baised around 0
+        # with
+        #     max(waveform) = +pkToPk/2
+        #     min(waveform) = -pkToPk/2
+        # map it onto [AWGMinVal, AWGMaxVal] with a single scale and shift
+        # instead of normalizing to [0, 1] first
+        minVal = self.AWGMinVal
+        maxVal = self.AWGMaxVal
+        scale = (maxVal - minVal) / pkToPk
+        shift = (maxVal + minVal) / 2
+
+        if (_quantizeAWGNumba is not None and waveform.ndim == 1 and
+                waveform.dtype in (np.float32, np.float64)):
+            # Same steps as below, but reading each sample only once
+            if out is None:
+                out = np.empty(waveform.size, dtype=np.int16)
+            _quantizeAWGNumba(
+                waveform, float(offsetVoltage), float(scale), float(shift),
+                minVal, maxVal, out)
+            return (out, offsetVoltage, pkToPk)
+
+        # make a copy of the original data as to not clobber up the array
+        # all the following operations are done in place on this copy
+        # float32 resolves far finer than the 16 bit DAC codes, and needs
+        # half the memory traffic of float64
+        waveform = np.subtract(waveform, offsetVoltage, dtype=np.float32)
+        waveform *= scale
+        waveform += shift
+
+        np.rint(waveform, out=waveform)
+
+        # funny floating point rounding errors
+        # clip before the conversion so nothing can wrap around in int16
+        # the float copy is clipped in place, so no temporary is needed
+        np.clip(waveform, minVal, maxVal, out=waveform)
+
+        # convert to an int16 typqe as requried by the function
+        if out is None:
+            waveform = waveform.astype(np.int16)
+        else:
+            out[...] = waveform
+            waveform = out
+
+        return (waveform, offsetVoltage, pkToPk)
+
     def getAWGDeltaPhase(self, timeIncrement):
         """
         Return the deltaPhase integer used by the AWG.
@@ -1056,24 +1785,49 @@ class _PicoscopeBase(object):
         The top 2**self.AWGBufferAddressWidth bits indicate which sample is
         being output by the DDS.
 
+        `timeIncrement` may also be an array, e.g. to scan through sample
+        rates, in which case an int64 array is returned. Scalars and arrays
+        go through the same floating point computation, so they always give
+        the same deltaPhase. See getAWGDeltaPhaseExact for a computation
+        without rounding errors.
         """
-        samplingFrequency = 1 / timeIncrement
-        deltaPhase = int(samplingFrequency / self.AWGDACFrequency *
-                         2 ** (self.AWGPhaseAccumulatorSize -
-                               self.AWGBufferAddressWidth))
+        phase = 1.0 / np.asarray(timeIncrement, dtype=np.float64)
+        phase /= self.AWGDACFrequency
+        phase *= self._awg_phase_scale
+        deltaPhase = np.trunc(phase).astype(np.int64)
+        if deltaPhase.ndim == 0:
+            return int(deltaPhase)
         return deltaPhase
 
+    def getAWGDeltaPhaseExact(self, timeIncrement):
+        """
+        Return the deltaPhase integer used by the AWG, without rounding errors.
+
+        The computation uses rational numbers, so that a time increment for
+        which deltaPhase is an integer gives exactly that integer instead of
+        one less, as the floating point division of getAWGDeltaPhase can.
+
+        Parameters
+        ----------
+        timeIncrement
+            Time between AWG samples in seconds, preferably as a
+            fractions.Fraction or a string such as "1/3000000" or "5e-9".
+            Floats are taken as their shortest decimal representation.
+        """
+        timeIncrement = Fraction(str(timeIncrement))
+        phase = Fraction(self._awg_phase_scale) / (timeIncrement *
+                                                   self._awg_dac_frequency)
+        return phase.numerator // phase.denominator
+
     def getAWGTimeIncrement(self, deltaPhase):
         """
         Return the time between AWG samples given a certain deltaPhase.
 
         You should use this function in conjunction with
         getAWGDeltaPhase to obtain the actual timestep of AWG.
-
+        `deltaPhase` may also be an array.
         """
-        samplingFrequency = deltaPhase * self.AWGDACFrequency / (
-            2 ** (self.AWGPhaseAccumulatorSize - self.AWGBufferAddressWidth))
-        return 1 / samplingFrequency
+        return self._awg_time_scale / deltaPhase
 
     def sigGenSoftwareControl(self, state=True):
         """
@@ -1085,7 +1839,15 @@ class _PicoscopeBase(object):
         """For 6000-series, 5000-series or certain 4000-series scopes ONLY,
         sets the resolution.
         """
-        self._lowLevelSetDeviceResolution(self.ADC_RESOLUTIONS[resolution])
+        resolutionAPI = self.ADC_RESOLUTIONS.get(resolution)
+        if resolutionAPI is None:
+            raise ValueError(
+                "Unknown resolution '%s'. Valid resolutions are %s." %
+                (resolution, ", ".join(
+                    "'%s'" % key for key in self.ADC_RESOLUTIONS)))
+        self._lowLevelSetDeviceResolution(resolutionAPI)
+        self._clearTimebaseCache()
+        self._updateScales()
 
     def getResolution(self):
         """Get the currently set resolution."""
@@ -1101,10 +1863,13 @@ class _PicoscopeBase(object):
 
     def open(self, serialNumber=None):
         """Open the scope, using `serialNumber` if given."""
+        self._clearTimebaseCache()
         self._lowLevelOpenUnit(serialNumber)
+        self._updateScales()
 
     def openUnitAsync(self, serialNumber=None):
         """Open the scope asynchronously, using `serialNumber` if given."""
+        self._clearTimebaseCache()
         self._lowLevelOpenUnitAsync(serialNumber)
 
     def openUnitProgress(self):
@@ -1118,28 +1883,56 @@ class _PicoscopeBase(object):
         completed : bool
             Whether the opening has completed.
         """
-        return self._lowLevelOpenUnitProgress()
+        progress = self._lowLevelOpenUnitProgress()
+        self._updateScales()
+        return progress
 
     def close(self):
         """
         Close the scope.
 
         You should call this yourself because the Python garbage collector
-        might take some time.
+        might take some time. Alternatively, use the scope as a context
+        manager: ``with ps6000.PS6000() as ps: ...``.
         """
-        if self.handle is not None:
+        if self.handle is None:
+            return
+        try:
             self._lowLevelCloseUnit()
+        finally:
+            # The drivers need the handle to close the unit, so it can only
+            # be dropped afterwards; but even if closing failed, the handle
+            # must not be closed a second time, e.g. by __del__.
             self.handle = None
+            self._clearTimebaseCache()
+            self._boundBuffers.clear()
+            self._captureBuffers.clear()
 
     def stop(self):
         """Stop scope acquisition."""
         self._lowLevelStop()
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
-    def checkResult(self, errorCode):
-        """Check result of function calls, raise exception if not 0."""
+    def __del__(self):
+        # __init__ may have failed before the handle was ever set, and
+        # exceptions raised here would only be printed to stderr anyway.
+        if getattr(self, 'handle', None) is not None:
+            try:
+                self.close()
+            except Exception:
+                pass
+
+    def checkResult(self, errorCode, caller=None):
+        """
+        Check result of function calls, raise exception if not 0.
+
+        The error message names `caller`, by default the calling function.
+        """
         # NOTE: This will break some oscilloscopes that are powered by USB.
         # Some of the newer scopes, can actually be powered by USB and will
         # return a useful value. That should be given back to the user.
@@ -1148,41 +1941,30 @@ class _PicoscopeBase(object):
             return
 
         else:
-            ecName = self.errorNumToName(errorCode)
-            ecDesc = self.errorNumToDesc(errorCode)
+            (ecName, ecDesc) = self._error_info.get(errorCode, (None, None))
+            if caller is None:
+                # sys._getframe only looks at the caller, unlike
+                # inspect.stack which builds the context of the whole stack.
+                caller = sys._getframe(1).f_code.co_name
             raise IOError('Error calling %s: %s (%s)' % (
-                str(inspect.stack()[1][3]), ecName, ecDesc))
+                caller, ecName, ecDesc))
 
     def errorNumToName(self, errorCode):
         """Return the name of the `errorCode` as a string."""
-        for t in self.ERROR_CODES:
-            if t[0] == errorCode:
-                return t[1]
+        info = self._error_info.get(errorCode)
+        if info is not None:
+            return info[0]
 
     def errorNumToDesc(self, errorCode):
         """Return the description of the `errorCode` as a string."""
-        for t in self.ERROR_CODES:
-            if t[0] == errorCode:
-                try:
-                    return t[2]
-                except IndexError:
-                    return ""
+        info = self._error_info.get(errorCode)
+        if info is not None:
+            return info[1]
 
     def changePowerSource(self, powerstate):
         """Change the powerstate of the scope.
 
         Valid only for PS54XXA/B?
         """
-        # I should probably make an enumerate table for these two cases,
-        # but they are in fact just the
-        # error codes. Picoscope should have made it a separate enumerate
-        # themselves.
-        # I'll just keep this hack for now
-        if not isinstance(powerstate, int):
-            if powerstate == "PICO_POWER_SUPPLY_CONNECTED":
-                powerstate = 0x119
-            elif powerstate == "PICO_POWER_SUPPLY_NOT_CONNECTED":
-                powerstate = 0x11A
-            elif powerstate == "PICO_USB3_0_DEVICE_NON_USB3_0_PORT":
-                powerstate = 0x11E
+        powerstate = _toInt(powerstate, self.POWER_STATES)
         self._lowLevelChangePowerSource(powerstate)
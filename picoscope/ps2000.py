@@ -19,7 +19,7 @@ from __future__ import unicode_literals
 
 # import math
 
-import inspect
+import sys
 
 # to load the proper dll
 import platform
@@ -115,9 +115,6 @@ class PS2000(_PicoscopeBase):
                        "ErrorCode": 0x6,
                        "KernelVersion": 0x7}
 
-    channelBuffersPtr = [c_void_p(), c_void_p()]
-    channelBuffersLen = [0, 0]
-
     SIGGEN_TRIGGER_TYPES = {"Rising": 0, "Falling": 1,
                             "GateHigh": 2, "GateLow": 3}
     SIGGEN_TRIGGER_SOURCES = {"None": 0, "ScopeTrig": 1, "AuxIn": 2,
@@ -136,16 +133,32 @@ class PS2000(_PicoscopeBase):
         """Load DLL etc."""
         if platform.system() == 'Linux':
             from ctypes import cdll
-            self.lib = cdll.LoadLibrary("lib" + self.LIBNAME + ".so")
+            self.lib = self._loadLibrary(cdll.LoadLibrary,
+                                         "lib" + self.LIBNAME + ".so")
         elif platform.system() == 'Darwin':
             from picoscope.darwin_utils import LoadLibraryDarwin
-            self.lib = LoadLibraryDarwin("lib" + self.LIBNAME + ".dylib")
+            self.lib = self._loadLibrary(LoadLibraryDarwin,
+                                         "lib" + self.LIBNAME + ".dylib")
         else:
             from ctypes import windll
             from ctypes.util import find_library
-            self.lib = windll.LoadLibrary(
-                find_library(str(self.LIBNAME + ".dll"))
-            )
+            self.lib = self._loadLibrary(
+                lambda name: windll.LoadLibrary(find_library(name)),
+                str(self.LIBNAME + ".dll"))
+
+        # Declare the argument types of the functions called while polling
+        # and transferring data, so that ctypes converts plain Python ints
+        # itself instead of a c_int16(...) object being built per call.
+        self.lib.ps2000_ready.argtypes = [c_int16]
+        self.lib.ps2000_get_values.argtypes = [
+            c_int16, c_void_p, c_void_p, c_void_p, c_void_p,
+            POINTER(c_int16), c_int32]
+
+        # Buffers registered by _lowLevelSetDataBuffer, which
+        # ps2000_get_values fills all at once. Kept per scope, so that two
+        # scopes never share them.
+        self.channelBuffersPtr = [c_void_p(), c_void_p()]
+        self.channelBuffersLen = [0, 0]
 
         super(PS2000, self).__init__(serialNumber, connect)
 
@@ -222,14 +235,13 @@ class PS2000(_PicoscopeBase):
         return timeIndisposedMs.value
 
     def _lowLevelIsReady(self):
-        ready = c_int16()
-        ready = self.lib.ps2000_ready(c_int16(self.handle))
+        ready = self.lib.ps2000_ready(self.handle)
         if ready > 0:
             return True
         elif ready == 0:
             return False
         else:
-            raise IOError("ps2000_ready returned %d" % ready.value)
+            raise IOError("ps2000_ready returned %d" % ready)
 
     def _lowLevelGetTimebase(self, tb, noSamples, oversample, segmentIndex):
         """Return (timeIntervalSeconds, maxSamples)."""
@@ -250,36 +262,25 @@ class PS2000(_PicoscopeBase):
 
     def getTimeBaseNum(self, sampleTimeS):
         """ps2000 doesn't seem to have published formula like other scopes."""
-        time_interval = c_int32()
-        timebases = [None] * self.MAX_TIMEBASES
-
         # Convert to nS
         sampleTimenS = sampleTimeS * 1E9
 
-        tb = 0
-        while tb < self.MAX_TIMEBASES:
-            rv = self.lib.ps2000_get_timebase(
-                c_int16(self.handle), c_int16(tb), c_uint32(512),
-                byref(time_interval), c_void_p(), c_int16(1),  c_void_p())
-            if rv != 0:
-                timebases[tb] = time_interval.value
-
-            tb += 1
-
         # Figure out closest option
-        besterror = 1E99
-        bestindx = 0
-        for indx, val in enumerate(timebases):
-            if val is not None:
-                error = sampleTimenS - val
-                if abs(error) < besterror:
-                    besterror = abs(error)
-                    bestindx = indx
-
-        return bestindx
+        intervals = self._timebaseIntervals()
+        valid = [tb for tb in range(self.MAX_TIMEBASES)
+                 if intervals[tb] is not None]
+        if not valid:
+            return 0
+        return min(valid, key=lambda tb: abs(sampleTimenS - intervals[tb]))
 
     def getTimestepFromTimebase(self, timebase):
         """Return timestep from timebase."""
+        intervals = self._timebaseIntervals()
+        if (0 <= timebase < self.MAX_TIMEBASES and
+                intervals[timebase] is not None):
+            return (intervals[timebase] / 1.0E9)
+
+        # Let the driver report why the timebase is not valid
         time_interval = c_int32()
         m = self.lib.ps2000_get_timebase(
             c_int16(self.handle), c_int16(timebase), c_uint32(512),
@@ -287,9 +288,31 @@ class PS2000(_PicoscopeBase):
         self.checkResult(m)
         return (time_interval.value / 1.0E9)
 
+    def _timebaseIntervals(self):
+        """
+        Return the sample interval in nS of each timebase.
+
+        The entries of invalid timebases are None. The driver is only asked
+        once, until _clearTimebaseCache is called on a change of the channels
+        or memory segments.
+        """
+        intervals = self._timebaseIntervalsCache
+        if intervals is None:
+            time_interval = c_int32()
+            intervals = [None] * self.MAX_TIMEBASES
+            for tb in range(self.MAX_TIMEBASES):
+                rv = self.lib.ps2000_get_timebase(
+                    c_int16(self.handle), c_int16(tb), c_uint32(512),
+                    byref(time_interval), c_void_p(), c_int16(1),
+                    c_void_p())
+                if rv != 0:
+                    intervals[tb] = time_interval.value
+            self._timebaseIntervalsCache = intervals
+        return intervals
+
     def _lowLevelSetDataBuffer(self, channel, data, downSampleMode,
                                segmentIndex):
-        dataPtr = data.ctypes.data_as(POINTER(c_int16))
+        dataPtr = data.ctypes._as_parameter_
         numSamples = len(data)
 
         self.channelBuffersPtr[channel] = dataPtr
@@ -305,13 +328,14 @@ class PS2000(_PicoscopeBase):
         # TODO: Check overflow in channelBuffersLen against numSamples,
         # but need to not raise error if channelBuffersPtr is void
 
+        (bufferA, bufferB) = self.channelBuffersPtr
         overflow = c_int16()
         rv = self.lib.ps2000_get_values(
-            c_int16(self.handle),
-            self.channelBuffersPtr[0],
-            self.channelBuffersPtr[1],
-            c_void_p(), c_void_p(),
-            byref(overflow), c_int32(numSamples))
+            self.handle,
+            bufferA,
+            bufferB,
+            None, None,
+            byref(overflow), numSamples)
 
         self.checkResult(rv)
         return (rv, overflow.value)
@@ -333,10 +357,12 @@ class PS2000(_PicoscopeBase):
             c_uint32(numSweeps))
         self.checkResult(m)
 
-    def checkResult(self, ec):
+    def checkResult(self, ec, caller=None):
         """Check result of function calls, raise exception if not 0."""
         # PS2000 differs from other drivers in that non-zero is good
         if ec == 0:
-            raise IOError('Error calling %s' % (inspect.stack()[1][3]))
+            if caller is None:
+                caller = sys._getframe(1).f_code.co_name
+            raise IOError('Error calling %s' % caller)
 
         return 0
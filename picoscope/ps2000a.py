@@ -57,7 +57,7 @@ import platform
 # float is always defined as 32 bits
 # double is defined as 64 bits
 from ctypes import byref, POINTER, create_string_buffer, c_float, \
-    c_int16, c_int32, c_uint16, c_uint32, c_void_p
+    c_int16, c_int32, c_int64, c_uint16, c_uint32, c_void_p
 from ctypes import c_int32 as c_enum
 
 from picoscope.picobase import _PicoscopeBase
@@ -129,15 +129,38 @@ class PS2000a(_PicoscopeBase):
         """Load DLL etc."""
         if platform.system() == 'Linux':
             from ctypes import cdll
-            self.lib = cdll.LoadLibrary("lib" + self.LIBNAME + ".so")
+            self.lib = self._loadLibrary(cdll.LoadLibrary,
+                                         "lib" + self.LIBNAME + ".so")
         elif platform.system() == 'Darwin':
-            self.lib = self.loadLibraryDarwin("lib" + self.LIBNAME + ".dylib")
+            from picoscope.darwin_utils import LoadLibraryDarwin
+            self.lib = self._loadLibrary(LoadLibraryDarwin,
+                                         "lib" + self.LIBNAME + ".dylib")
         else:
             from ctypes import windll
             from ctypes.util import find_library
-            self.lib = windll.LoadLibrary(
-                find_library(str(self.LIBNAME + ".dll"))
-            )
+            self.lib = self._loadLibrary(
+                lambda name: windll.LoadLibrary(find_library(name)),
+                str(self.LIBNAME + ".dll"))
+
+        # Declare the argument types of the functions called while polling
+        # and transferring data, so that ctypes converts plain Python ints
+        # itself instead of a c_int16(...) object being built per argument.
+        self.lib.ps2000aIsReady.argtypes = [c_int16, POINTER(c_int16)]
+        self.lib.ps2000aSetDataBuffer.argtypes = [
+            c_int16, c_enum, c_void_p, c_int32, c_uint32, c_enum]
+        self.lib.ps2000aGetValues.argtypes = [
+            c_int16, c_uint32, POINTER(c_uint32), c_uint32, c_enum, c_uint32,
+            POINTER(c_int16)]
+        self.lib.ps2000aGetValuesBulk.argtypes = [
+            c_int16, POINTER(c_uint32), c_uint32, c_uint32, c_uint32, c_enum,
+            c_void_p]
+
+        # Reused by every _lowLevelGetUnitInfo call, grown when too small
+        self._unitInfoBuffer = create_string_buffer(256)
+
+        # Output of the ps2000aIsReady polls, reused by every poll
+        self._ready = c_int16()
+        self._readyRef = byref(self._ready)
 
         self.resolution = self.ADC_RESOLUTIONS["8"]
 
@@ -158,27 +181,19 @@ class PS2000a(_PicoscopeBase):
         # the particular model. See section 2.8 (pg 27) of the 2000a
         # programmer's guide
         self.model = self.getUnitInfo('VariantInfo')
+        # Timebases below fastTimebases sample at fastRate / 2**n, the
+        # others at slowRate / (n - slowOffset):
+        # (fastRate, fastTimebases, slowRate, slowOffset)
         if self.model in ('2205AMSO', '2206', '2206A', '2206B', '2405A'):
             # 500 MS/s
-            self._timebase_to_timestep = \
-                lambda n: (2**n / 5e8) if n < 3 else ((n - 2) / 625e5)
-            self._timestep_to_timebase = \
-                lambda t: math.log(t * 5e8, 2) if t < 16e-9 else (
-                    (t * 625e5) + 2)
+            self._timebaseParams = (5e8, 3, 625e5, 2)
         elif self.model in ('2206BMSO', '2207', '2207A', '2207B', '2207BMSO',
                             '2208', '2208A', '2208B', '2208BMSO', '2406B',
                             '2407B', '2408B'):
             # 1 GS/s
-            self._timebase_to_timestep = lambda n: (2**n / 1e9) if n < 3 else (
-                (n - 2) / 125e6)
-            self._timestep_to_timebase = \
-                lambda t: math.log(t * 1e9, 2) if t < 8e-9 else (
-                    (t * 125e6) + 2)
+            self._timebaseParams = (1e9, 3, 125e6, 2)
         elif self.model == '2205MSO':
-            self._timebase_to_timestep = \
-                lambda n: (2**n / 2e8) if n < 1 else (n / 1e8)
-            self._timestep_to_timebase = \
-                lambda t: math.log(t * 2e8, 2) if t < 10e-9 else (t * 1e8)
+            self._timebaseParams = (2e8, 1, 1e8, 0)
         else:
             raise ValueError("Unrecognised variant {}".format(self.model))
 
@@ -218,7 +233,7 @@ class PS2000a(_PicoscopeBase):
         self.checkResult(m)
 
     def _lowLevelGetUnitInfo(self, info):
-        s = create_string_buffer(256)
+        s = self._unitInfoBuffer
         requiredSize = c_int16(0)
 
         m = self.lib.ps2000aGetUnitInfo(c_int16(self.handle), byref(s),
@@ -227,6 +242,7 @@ class PS2000a(_PicoscopeBase):
         self.checkResult(m)
         if requiredSize.value > len(s):
             s = create_string_buffer(requiredSize.value + 1)
+            self._unitInfoBuffer = s
             m = self.lib.ps2000aGetUnitInfo(c_int16(self.handle), byref(s),
                                             c_int16(len(s)),
                                             byref(requiredSize), c_enum(info))
@@ -285,13 +301,9 @@ class PS2000a(_PicoscopeBase):
         return timeIndisposedMs.value
 
     def _lowLevelIsReady(self):
-        ready = c_int16()
-        m = self.lib.ps2000aIsReady(c_int16(self.handle), byref(ready))
+        m = self.lib.ps2000aIsReady(self.handle, self._readyRef)
         self.checkResult(m)
-        if ready.value:
-            return True
-        else:
-            return False
+        return bool(self._ready.value)
 
     def _lowLevelGetTimebase(self, tb, noSamples, oversample, segmentIndex):
         """Return (timeIntervalSeconds, maxSamples)."""
@@ -308,24 +320,45 @@ class PS2000a(_PicoscopeBase):
 
     def getTimeBaseNum(self, sampleTimeS):
         """Convert sample time in S to something to pass to API Call."""
-        clipped = np.clip(math.floor(self._timestep_to_timebase(sampleTimeS)),
-                          0, np.iinfo(np.int32).max)
-
-        return int(clipped)
+        timebase = int(math.floor(self._timestep_to_timebase(sampleTimeS)))
+        # clip to the range of the uint32 timebase argument, keeping it
+        # representable as an int32 too
+        return min(max(timebase, 0), 2 ** 31 - 1)
 
     def getTimestepFromTimebase(self, timebase):
         """Convvert API timestep code to sampling interval.
 
         API timestep as an integer from 0-32,
         sampling interval in seconds.
+        `timebase` may also be an array of timebases.
         """
         return self._timebase_to_timestep(timebase)
 
+    def _timebase_to_timestep(self, n):
+        (fastRate, fastTimebases, slowRate, slowOffset) = self._timebaseParams
+        if np.ndim(n) == 0:
+            if n < fastTimebases:
+                return 2 ** n / fastRate
+            return (n - slowOffset) / slowRate
+
+        # Both branches are evaluated for every element, so the exponent is
+        # capped to keep 2**n finite for the slow timebases
+        n = np.asarray(n)
+        return np.where(n < fastTimebases,
+                        np.exp2(np.minimum(n, fastTimebases)) / fastRate,
+                        (n - slowOffset) / slowRate)
+
+    def _timestep_to_timebase(self, t):
+        (fastRate, fastTimebases, slowRate, slowOffset) = self._timebaseParams
+        if t < 2 ** fastTimebases / fastRate:
+            return math.log(t * fastRate, 2)
+        return t * slowRate + slowOffset
+
     def _lowLevelSetAWGSimpleDeltaPhase(self, waveform, deltaPhase,
                                         offsetVoltage, pkToPk, indexMode,
                                         shots, triggerType, triggerSource):
         """Waveform should be an array of shorts."""
-        waveformPtr = waveform.ctypes.data_as(POINTER(c_int16))
+        waveformPtr = waveform.ctypes._as_parameter_
 
         m = self.lib.ps2000aSetSigGenArbitrary(
             c_int16(self.handle),
@@ -355,13 +388,12 @@ class PS2000a(_PicoscopeBase):
         when you are done with the data array
         or else subsequent calls to GetValue will still use the same array.
         """
-        dataPtr = data.ctypes.data_as(POINTER(c_int16))
+        dataPtr = data.ctypes._as_parameter_
         numSamples = len(data)
 
         m = self.lib.ps2000aSetDataBuffer(
-            c_int16(self.handle), c_enum(channel), dataPtr,
-            c_int32(numSamples), c_uint32(segmentIndex),
-            c_enum(downSampleMode))
+            self.handle, channel, dataPtr, numSamples, segmentIndex,
+            downSampleMode)
         self.checkResult(m)
 
     def _lowLevelSetMultipleDataBuffers(self, channel, data, downSampleMode):
@@ -373,16 +405,25 @@ class PS2000a(_PicoscopeBase):
         if data.shape[1] < self.maxSamples:
             raise ValueError("data array has fewer columns than maxSamples")
 
+        if data.dtype != np.int16 or not data.flags.carray:
+            raise TypeError("data must be a c_contiguous, aligned and " +
+                            "writeable int16 array")
+
+        # Register each row by its address, instead of building a view and
+        # a ctypes pointer per segment.
+        address = data.ctypes.data
+        stride = data.strides[0]
+        numSamples = data.shape[1]
+        setDataBuffer = self.lib.ps2000aSetDataBuffer
         for i in range(max_segments):
-            m = self._lowLevelSetDataBuffer(channel, data[i, :],
-                                            downSampleMode, i)
+            m = setDataBuffer(self.handle, channel, address + i * stride,
+                              numSamples, i, downSampleMode)
             self.checkResult(m)
 
     def _lowLevelClearDataBuffer(self, channel, segmentIndex):
         """Clear the data in the picoscope."""
         m = self.lib.ps2000aSetDataBuffer(
-            c_int16(self.handle), c_enum(channel),
-            c_void_p(), c_uint32(0), c_uint32(segmentIndex), c_enum(0))
+            self.handle, channel, None, 0, segmentIndex, 0)
         self.checkResult(m)
 
     def _lowLevelGetValues(self, numSamples, startIndex, downSampleRatio,
@@ -391,45 +432,40 @@ class PS2000a(_PicoscopeBase):
         numSamplesReturned.value = numSamples
         overflow = c_int16()
         m = self.lib.ps2000aGetValues(
-            c_int16(self.handle), c_uint32(startIndex),
-            byref(numSamplesReturned), c_uint32(downSampleRatio),
-            c_enum(downSampleMode), c_uint32(segmentIndex),
-            byref(overflow))
+            self.handle, startIndex, byref(numSamplesReturned),
+            downSampleRatio, downSampleMode, segmentIndex, byref(overflow))
         self.checkResult(m)
         return (numSamplesReturned.value, overflow.value)
 
     def _lowLevelGetValuesBulk(self, numSamples, fromSegment, toSegment,
                                downSampleRatio, downSampleMode, overflow):
         m = self.lib.ps2000aGetValuesBulk(
-            c_int16(self.handle),
-            byref(c_int16(numSamples)),
-            c_int16(fromSegment),
-            c_int16(toSegment),
-            c_int32(downSampleRatio),
-            c_int16(downSampleMode),
-            overflow.ctypes.data_as(POINTER(c_int16))
+            self.handle,
+            byref(c_uint32(numSamples)),
+            fromSegment,
+            toSegment,
+            downSampleRatio,
+            downSampleMode,
+            overflow.ctypes._as_parameter_
             )
         self.checkResult(m)
         return overflow, numSamples
 
     def _lowLevelGetTriggerTimeOffset(self, segmentIndex):
-        timeUpper = c_uint32()
-        timeLower = c_uint32()
-        timeUnits = c_int16()
-        m = self.lib.ps2000aGetTriggerTimeOffset(
+        # The 64 bit variant returns the time as a single integer, instead
+        # of its upper and lower 4 bytes, which is scaled by timeUnits to get
+        # the precise trigger location
+        time = c_int64()
+        timeUnits = c_enum()
+        m = self.lib.ps2000aGetTriggerTimeOffset64(
             c_int16(self.handle),
-            byref(timeUpper),
-            byref(timeLower),
+            byref(time),
             byref(timeUnits),
             c_uint32(segmentIndex),
             )
         self.checkResult(m)
 
-        # timeUpper and timeLower are the upper 4 and lower 4 bytes of a 64-bit
-        # (8-byte) integer which is scaled by timeUnits to get the precise
-        # trigger location
-        return (((timeUpper.value << 32) + timeLower.value) *
-                self.TIME_UNITS[timeUnits.value])
+        return time.value * self.TIME_UNITS[timeUnits.value]
 
     def _lowLevelSetSigGenBuiltInSimple(self, offsetVoltage, pkToPk, waveType,
                                         frequency, shots, triggerType,
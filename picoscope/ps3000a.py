@@ -45,6 +45,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import math
+import numpy as np
 
 # to load the proper dll
 import platform
@@ -54,7 +55,7 @@ import platform
 # use the values specified in the h file
 # float is always defined as 32 bits
 # double is defined as 64 bits
-from ctypes import byref, POINTER, create_string_buffer, c_float, \
+from ctypes import byref, create_string_buffer, c_float, \
     c_int16, c_int32, c_uint16, c_uint32, c_void_p
 from ctypes import c_int32 as c_enum
 
@@ -136,16 +137,18 @@ class PS3000a(_PicoscopeBase):
         """Load DLL etc."""
         if platform.system() == 'Linux':
             from ctypes import cdll
-            self.lib = cdll.LoadLibrary("lib" + self.LIBNAME + ".so")
+            self.lib = self._loadLibrary(cdll.LoadLibrary,
+                                         "lib" + self.LIBNAME + ".so")
         elif platform.system() == 'Darwin':
             from picoscope.darwin_utils import LoadLibraryDarwin
-            self.lib = LoadLibraryDarwin("lib" + self.LIBNAME + ".dylib")
+            self.lib = self._loadLibrary(LoadLibraryDarwin,
+                                         "lib" + self.LIBNAME + ".dylib")
         else:
             from ctypes import windll
             from ctypes.util import find_library
-            self.lib = windll.LoadLibrary(
-                find_library(str(self.LIBNAME + ".dll"))
-            )
+            self.lib = self._loadLibrary(
+                lambda name: windll.LoadLibrary(find_library(name)),
+                str(self.LIBNAME + ".dll"))
 
         self.resolution = self.ADC_RESOLUTIONS["8"]
 
@@ -340,7 +343,7 @@ class PS3000a(_PicoscopeBase):
                                         offsetVoltage, pkToPk, indexMode,
                                         shots, triggerType, triggerSource):
         """Waveform should be an array of shorts."""
-        waveformPtr = waveform.ctypes.data_as(POINTER(c_int16))
+        waveformPtr = waveform.ctypes._as_parameter_
 
         m = self.lib.ps3000aSetSigGenArbitrary(
             c_int16(self.handle),
@@ -370,7 +373,7 @@ class PS3000a(_PicoscopeBase):
         when you are done with the data array
         or else subsequent calls to GetValue will still use the same array.
         """
-        dataPtr = data.ctypes.data_as(POINTER(c_int16))
+        dataPtr = data.ctypes._as_parameter_
         numSamples = len(data)
 
         m = self.lib.ps3000aSetDataBuffer(
@@ -401,9 +404,22 @@ class PS3000a(_PicoscopeBase):
         if data.shape[1] < self.maxSamples:
             raise ValueError("data array has fewer columns than maxSamples")
 
+        if data.dtype != np.int16 or not data.flags.carray:
+            raise TypeError("data must be a c_contiguous, aligned and " +
+                            "writeable int16 array")
+
+        # Register each row by its address, instead of building a view and
+        # a ctypes pointer per segment.
+        address = data.ctypes.data
+        stride = data.strides[0]
+        handle = c_int16(self.handle)
+        channel = c_enum(channel)
+        numSamples = c_int32(data.shape[1])
+        downSampleMode = c_enum(downSampleMode)
+        setDataBuffer = self.lib.ps3000aSetDataBuffer
         for i in range(max_segments):
-            m = self._lowLevelSetDataBuffer(channel, data[i, :],
-                                            downSampleMode, i)
+            m = setDataBuffer(handle, channel, c_void_p(address + i * stride),
+                              numSamples, c_uint32(i), downSampleMode)
             self.checkResult(m)
 
     def _lowLevelClearDataBuffer(self, channel, segmentIndex):
@@ -436,7 +452,7 @@ class PS3000a(_PicoscopeBase):
             c_uint32(toSegment),
             c_uint32(downSampleRatio),
             c_int16(downSampleMode),
-            overflow.ctypes.data_as(POINTER(c_int16))
+            overflow.ctypes._as_parameter_
             )
         self.checkResult(m)
         return overflow, numSamples
@@ -58,7 +58,7 @@ import platform
 # use the values specified in the h file
 # float is always defined as 32 bits
 # double is defined as 64 bits
-from ctypes import byref, POINTER, create_string_buffer, c_float, c_double, \
+from ctypes import byref, create_string_buffer, c_float, c_double, \
     c_int16, c_uint16, c_int32, c_uint32, c_uint64, c_void_p, c_int8, \
     CFUNCTYPE
 from ctypes import c_int32 as c_enum
@@ -195,16 +195,18 @@ class PS4000a(_PicoscopeBase):
             from ctypes import cdll
             # ok I don't know what is wrong with my installer,
             # but I need to include .so.2
-            self.lib = cdll.LoadLibrary("lib" + self.LIBNAME + ".so.2")
+            self.lib = self._loadLibrary(cdll.LoadLibrary,
+                                         "lib" + self.LIBNAME + ".so.2")
         elif platform.system() == 'Darwin':
             from picoscope.darwin_utils import LoadLibraryDarwin
-            self.lib = LoadLibraryDarwin("lib" + self.LIBNAME + ".dylib")
+            self.lib = self._loadLibrary(LoadLibraryDarwin,
+                                         "lib" + self.LIBNAME + ".dylib")
         else:
             from ctypes import windll
             from ctypes.util import find_library
-            self.lib = windll.LoadLibrary(
-                find_library(str(self.LIBNAME + ".dll"))
-            )
+            self.lib = self._loadLibrary(
+                lambda name: windll.LoadLibrary(find_library(name)),
+                str(self.LIBNAME + ".dll"))
 
         self.resolution = self.ADC_RESOLUTIONS["12"]
 
@@ -454,7 +456,7 @@ class PS4000a(_PicoscopeBase):
                                         offsetVoltage, pkToPk, indexMode,
                                         shots, triggerType, triggerSource):
         """Waveform should be an array of shorts."""
-        waveformPtr = waveform.ctypes.data_as(POINTER(c_int16))
+        waveformPtr = waveform.ctypes._as_parameter_
 
         m = self.lib.ps4000aSetSigGenArbitrary(
             c_int16(self.handle),
@@ -484,7 +486,7 @@ class PS4000a(_PicoscopeBase):
         when you are done with the data array
         or else subsequent calls to GetValue will still use the same array.
         """
-        dataPtr = data.ctypes.data_as(POINTER(c_int16))
+        dataPtr = data.ctypes._as_parameter_
         numSamples = len(data)
 
         m = self.lib.ps4000aSetDataBuffer(c_int16(self.handle),
@@ -543,7 +545,7 @@ class PS4000a(_PicoscopeBase):
     def _lowLevelGetValuesBulk(self, numSamples, fromSegment, toSegment,
                                downSampleRatio, downSampleMode, overflow):
         """Copy data from several memory segments at once."""
-        overflowPoint = overflow.ctypes.data_as(POINTER(c_int16))
+        overflowPoint = overflow.ctypes._as_parameter_
         m = self.lib.ps4000aGetValuesBulk(
             c_int16(self.handle),
             byref(c_int32(numSamples)),
@@ -661,8 +663,8 @@ class PS4000a(_PicoscopeBase):
 
     def _lowLevelSetDataBuffers(self, channel, bufferMax, bufferMin,
                                 downSampleRatioMode):
-        bufferMaxPtr = bufferMax.ctypes.data_as(POINTER(c_int16))
-        bufferMinPtr = bufferMin.ctypes.data_as(POINTER(c_int16))
+        bufferMaxPtr = bufferMax.ctypes._as_parameter_
+        bufferMinPtr = bufferMin.ctypes._as_parameter_
         bufferLth = len(bufferMax)
 
         m = self.lib.ps4000aSetDataBuffers(
@@ -58,7 +58,7 @@ import platform
 # use the values specified in the h file
 # float is always defined as 32 bits
 # double is defined as 64 bits
-from ctypes import byref, POINTER, create_string_buffer, c_float, \
+from ctypes import byref, create_string_buffer, c_float, \
     c_int16, c_int32, c_uint32, c_uint64, c_void_p
 from ctypes import c_int32 as c_enum
 
@@ -140,16 +140,18 @@ class PS5000(_PicoscopeBase):
             from ctypes import cdll
             # ok I don't know what is wrong with my installer,
             # but I need to include .so.2
-            self.lib = cdll.LoadLibrary("lib" + self.LIBNAME + ".so.2")
+            self.lib = self._loadLibrary(cdll.LoadLibrary,
+                                         "lib" + self.LIBNAME + ".so.2")
         elif platform.system() == 'Darwin':
             from picoscope.darwin_utils import LoadLibraryDarwin
-            self.lib = LoadLibraryDarwin("lib" + self.LIBNAME + ".dylib")
+            self.lib = self._loadLibrary(LoadLibraryDarwin,
+                                         "lib" + self.LIBNAME + ".dylib")
         else:
             from ctypes import windll
             from ctypes.util import find_library
-            self.lib = windll.LoadLibrary(
-                find_library(str(self.LIBNAME + ".dll"))
-            )
+            self.lib = self._loadLibrary(
+                lambda name: windll.LoadLibrary(find_library(name)),
+                str(self.LIBNAME + ".dll"))
 
         super(PS5000, self).__init__(serialNumber, connect)
 
@@ -338,7 +340,7 @@ class PS5000(_PicoscopeBase):
         segmentIndex is unused, but required by other versions of the API
         (eg PS5000a)
         """
-        dataPtr = data.ctypes.data_as(POINTER(c_int16))
+        dataPtr = data.ctypes._as_parameter_
         numSamples = len(data)
 
         m = self.lib.ps5000SetDataBuffer(c_int16(self.handle), c_enum(channel),
@@ -372,7 +374,7 @@ class PS5000(_PicoscopeBase):
                                         offsetVoltage, pkToPk, indexMode,
                                         shots, triggerType, triggerSource):
         """Waveform should be an array of shorts."""
-        waveformPtr = waveform.ctypes.data_as(POINTER(c_int16))
+        waveformPtr = waveform.ctypes._as_parameter_
 
         m = self.lib.ps5000SetSigGenArbitrary(
             c_int16(self.handle),
@@ -486,8 +488,8 @@ class PS5000(_PicoscopeBase):
 
     def _lowLevelSetDataBuffers(self, channel, bufferMax, bufferMin,
                                 downSampleRatioMode):
-        bufferMaxPtr = bufferMax.ctypes.data_as(POINTER(c_int16))
-        bufferMinPtr = bufferMin.ctypes.data_as(POINTER(c_int16))
+        bufferMaxPtr = bufferMax.ctypes._as_parameter_
+        bufferMinPtr = bufferMin.ctypes._as_parameter_
         bufferLth = len(bufferMax)
 
         m = self.lib.ps5000SetDataBuffers(c_int16(self.handle),
@@ -518,14 +520,14 @@ class PS5000(_PicoscopeBase):
             byref(noOfSamples),
             c_uint32(fromSegmentIndex), c_uint32(toSegmentIndex),
             c_uint32(downSampleRatio), c_enum(downSampleRatioMode),
-            overflow.ctypes.data_as(POINTER(c_int16))
+            overflow.ctypes._as_parameter_
             )
         self.checkResult(m)
         return noOfSamples.value
 
     def _lowLevelSetDataBufferBulk(self, channel, buffer, waveform,
                                    downSampleRatioMode):
-        bufferPtr = buffer.ctypes.data_as(POINTER(c_int16))
+        bufferPtr = buffer.ctypes._as_parameter_
         bufferLth = len(buffer)
 
         m = self.lib.ps5000SetDataBufferBulk(
@@ -536,8 +538,8 @@ class PS5000(_PicoscopeBase):
 
     def _lowLevelSetDataBuffersBulk(self, channel, bufferMax, bufferMin,
                                     waveform, downSampleRatioMode):
-        bufferMaxPtr = bufferMax.ctypes.data_as(POINTER(c_int16))
-        bufferMinPtr = bufferMin.ctypes.data_as(POINTER(c_int16))
+        bufferMaxPtr = bufferMax.ctypes._as_parameter_
+        bufferMinPtr = bufferMin.ctypes._as_parameter_
 
         bufferLth = len(bufferMax)
 
@@ -144,16 +144,18 @@ class PS5000a(_PicoscopeBase):
         """Load DLL etc."""
         if platform.system() == 'Linux':
             from ctypes import cdll
-            self.lib = cdll.LoadLibrary("lib" + self.LIBNAME + ".so")
+            self.lib = self._loadLibrary(cdll.LoadLibrary,
+                                         "lib" + self.LIBNAME + ".so")
         elif platform.system() == 'Darwin':
             from picoscope.darwin_utils import LoadLibraryDarwin
-            self.lib = LoadLibraryDarwin("lib" + self.LIBNAME + ".dylib")
+            self.lib = self._loadLibrary(LoadLibraryDarwin,
+                                         "lib" + self.LIBNAME + ".dylib")
         else:
             from ctypes import windll
             from ctypes.util import find_library
-            self.lib = windll.LoadLibrary(
-                find_library(str(self.LIBNAME + ".dll"))
-            )
+            self.lib = self._loadLibrary(
+                lambda name: windll.LoadLibrary(find_library(name)),
+                str(self.LIBNAME + ".dll"))
 
         self.resolution = self.ADC_RESOLUTIONS["8"]
 
@@ -399,7 +401,7 @@ class PS5000a(_PicoscopeBase):
                                         offsetVoltage, pkToPk, indexMode,
                                         shots, triggerType, triggerSource):
         """Waveform should be an array of shorts."""
-        waveformPtr = waveform.ctypes.data_as(POINTER(c_int16))
+        waveformPtr = waveform.ctypes._as_parameter_
 
         m = self.lib.ps5000aSetSigGenArbitrary(
             c_int16(self.handle),
@@ -429,7 +431,7 @@ class PS5000a(_PicoscopeBase):
         when you are done with the data array
         or else subsequent calls to GetValue will still use the same array.
         """
-        dataPtr = data.ctypes.data_as(POINTER(c_int16))
+        dataPtr = data.ctypes._as_parameter_
         numSamples = len(data)
 
         m = self.lib.ps5000aSetDataBuffer(c_int16(self.handle),
@@ -517,7 +519,7 @@ class PS5000a(_PicoscopeBase):
     def _lowLevelGetValuesBulk(self, numSamples, fromSegment, toSegment,
                                downSampleRatio, downSampleMode, overflow):
         """Copy data from several memory segments at once."""
-        overflowPoint = overflow.ctypes.data_as(POINTER(c_int16))
+        overflowPoint = overflow.ctypes._as_parameter_
         m = self.lib.ps5000aGetValuesBulk(
             c_int16(self.handle),
             byref(c_int32(numSamples)),
@@ -552,12 +554,9 @@ class PS5000a(_PicoscopeBase):
 
         nSegments = toSegment - fromSegment + 1
         # time = c_int64()
-        times = np.ascontiguousarray(
-            np.zeros(nSegments, dtype=np.int64)
-            )
-        timeUnits = np.ascontiguousarray(
-            np.zeros(nSegments, dtype=np.int32)
-            )
+        # Filled in by the driver, no need to zero them first
+        times = np.empty(nSegments, dtype=np.int64)
+        timeUnits = np.empty(nSegments, dtype=np.int32)
 
         m = self.lib.ps5000aGetValuesTriggerTimeOffsetBulk64(
             c_int16(self.handle),
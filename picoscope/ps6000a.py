@@ -58,7 +58,7 @@ import platform
 # use the values specified in the h file
 # float is always defined as 32 bits
 # double is defined as 64 bits
-from ctypes import byref, POINTER, create_string_buffer, c_float, c_int8, \
+from ctypes import byref, create_string_buffer, c_float, c_int8, \
     c_double, c_int16, c_uint16, c_int32, c_uint32, c_int64, c_uint64, \
     c_void_p, CFUNCTYPE
 from ctypes import c_int32 as c_enum
@@ -222,16 +222,18 @@ class PS6000a(_PicoscopeBase):
             from ctypes import cdll
             # ok I don't know what is wrong with my installer,
             # but I need to include .so.2
-            self.lib = cdll.LoadLibrary("lib" + self.LIBNAME + ".so.2")
+            self.lib = self._loadLibrary(cdll.LoadLibrary,
+                                         "lib" + self.LIBNAME + ".so.2")
         elif platform.system() == 'Darwin':
             from picoscope.darwin_utils import LoadLibraryDarwin
-            self.lib = LoadLibraryDarwin("lib" + self.LIBNAME + ".dylib")
+            self.lib = self._loadLibrary(LoadLibraryDarwin,
+                                         "lib" + self.LIBNAME + ".dylib")
         else:
             from ctypes import windll
             from ctypes.util import find_library
-            self.lib = windll.LoadLibrary(
-                find_library(str(self.LIBNAME + ".dll"))
-            )
+            self.lib = self._loadLibrary(
+                lambda name: windll.LoadLibrary(find_library(name)),
+                str(self.LIBNAME + ".dll"))
 
         super(PS6000a, self).__init__(serialNumber, connect)
 
@@ -530,7 +532,7 @@ class PS6000a(_PicoscopeBase):
         """
         if downSampleMode == 0:
             downSampleMode = self.RATIO_MODE['raw']
-        dataPtr = data.ctypes.data_as(POINTER(c_int16))
+        dataPtr = data.ctypes._as_parameter_
         numSamples = len(data)
 
         m = self.lib.ps6000aSetDataBuffer(c_int16(self.handle),
@@ -602,7 +604,7 @@ class PS6000a(_PicoscopeBase):
                                overflow):
         if downSampleMode == 0:
             downSampleMode = self.RATIO_MODE['raw']
-        overflowPoint = overflow.ctypes.data_as(POINTER(c_int16))
+        overflowPoint = overflow.ctypes._as_parameter_
         m = self.lib.ps6000aGetValuesBulk(
             c_int16(self.handle),
             c_uint64(0),  # startIndex
@@ -732,8 +734,8 @@ class PS6000a(_PicoscopeBase):
         if downSampleMode == 0:
             downSampleMode = self.RATIO_MODE['raw']
         raise NotImplementedError()
-        bufferMaxPtr = bufferMax.ctypes.data_as(POINTER(c_int16))
-        bufferMinPtr = bufferMin.ctypes.data_as(POINTER(c_int16))
+        bufferMaxPtr = bufferMax.ctypes._as_parameter_
+        bufferMinPtr = bufferMin.ctypes._as_parameter_
         bufferLth = len(bufferMax)
 
         m = self.lib.ps6000aSetDataBuffers(c_int16(self.handle),
@@ -0,0 +1,133 @@
+"""
+Fixtures for testing _PicoscopeBase without a scope.
+
+The driver is replaced by FakeScope, whose _lowLevel* methods keep track of
+the buffers registered with it and fill them like GetValues would.
+"""
+
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy as np
+import pytest
+
+from picoscope.picobase import _PicoscopeBase
+
+
+class FakeScope(_PicoscopeBase):
+    """Scope with a simulated driver, see the module docstring."""
+
+    AWGPhaseAccumulatorSize = 32
+    AWGBufferAddressWidth = 14
+    AWGMaxSamples = 2 ** AWGBufferAddressWidth
+    AWGDACInterval = 5E-9  # in seconds
+    AWGDACFrequency = 1 / AWGDACInterval
+    AWGMaxVal = 0x0FFF
+    AWGMinVal = 0x0000
+
+    WAVE_TYPES = {"Sine": 0, "Square": 1}
+    SWEEP_TYPES = {"Up": 0, "Down": 1}
+    SIGGEN_TRIGGER_TYPES = {"Rising": 0, "Falling": 1}
+    SIGGEN_TRIGGER_SOURCES = {"None": 0, "ScopeTrig": 1}
+
+    def __init__(self, maxSamples=1000):
+        # (channel, segmentIndex) -> array the driver currently writes to
+        self.registered = {}
+        # names of the low level calls, in order
+        self.calls = []
+        # exception raised by the next _lowLevelGetValues call
+        self.getValuesError = None
+        self.awgWaveform = None
+        super(FakeScope, self).__init__(connect=False)
+        self.handle = 1
+        self.maxSamples = maxSamples
+        self.noSamples = maxSamples
+        self.noSegments = 1
+        self.timebase = 0
+        self.oversample = 0
+
+    @staticmethod
+    def sample(channel, segmentIndex, numSamples):
+        """Return the samples the fake driver transfers."""
+        return (1000 * (channel + 1) + 100 * segmentIndex +
+                np.arange(numSamples) % 100).astype(np.int16)
+
+    def _lowLevelSetChannel(self, chNum, enabled, coupling, VRange, VOffset,
+                            BWLimited):
+        self.calls.append("SetChannel")
+
+    def _lowLevelMemorySegments(self, noSegments):
+        self.calls.append("MemorySegments")
+        return self.maxSamples // noSegments
+
+    def _lowLevelRunBlock(self, numPreTrigSamples, numPostTrigSamples,
+                          timebase, oversample, segmentIndex, callback,
+                          pParameter):
+        self.calls.append("RunBlock")
+
+    def _lowLevelIsReady(self):
+        return True
+
+    def _lowLevelCloseUnit(self):
+        self.calls.append("CloseUnit")
+
+    def _lowLevelStop(self):
+        self.calls.append("Stop")
+
+    def _lowLevelSetDataBuffer(self, channel, data, downSampleMode,
+                               segmentIndex):
+        self.calls.append("SetDataBuffer")
+        self.registered[(channel, segmentIndex)] = data
+
+    def _lowLevelSetDataBufferBulk(self, channel, data, segmentIndex,
+                                   downSampleMode):
+        self.calls.append("SetDataBufferBulk")
+        self.registered[(channel, segmentIndex)] = data
+
+    def _lowLevelClearDataBuffer(self, channel, segmentIndex):
+        self.calls.append("ClearDataBuffer")
+        self.registered.pop((channel, segmentIndex), None)
+
+    def _fill(self, numSamples, segmentIndex):
+        filled = False
+        for (channel, segment), data in self.registered.items():
+            if segment == segmentIndex:
+                data[:numSamples] = self.sample(channel, segment, numSamples)
+                filled = True
+        if not filled:
+            raise IOError("PICO_NO_SAMPLES_AVAILABLE")
+
+    def _lowLevelGetValues(self, numSamples, startIndex, downSampleRatio,
+                           downSampleMode, segmentIndex):
+        self.calls.append("GetValues")
+        if self.getValuesError is not None:
+            error, self.getValuesError = self.getValuesError, None
+            raise error
+        self._fill(numSamples, segmentIndex)
+        return (numSamples, 0)
+
+    def _lowLevelGetValuesBulk(self, numSamples, fromSegment, toSegment,
+                               downSampleRatio, downSampleMode, overflow):
+        self.calls.append("GetValuesBulk")
+        for segmentIndex in range(fromSegment, toSegment + 1):
+            self._fill(numSamples, segmentIndex)
+        overflow[:] = 0
+
+    def _lowLevelSetAWGSimpleDeltaPhase(self, waveform, deltaPhase,
+                                        offsetVoltage, pkToPk, indexMode,
+                                        shots, triggerType, triggerSource):
+        self.calls.append("SetAWGSimpleDeltaPhase")
+        self.awgWaveform = waveform.copy()
+
+    def checkBindings(self):
+        """Assert that _boundBuffers matches the driver's registrations."""
+        assert set(self._boundBuffers) == set(self.registered)
+        for key, (data, _) in self._boundBuffers.items():
+            assert self.registered[key] is data
+
+
+@pytest.fixture
+def scope():
+    return FakeScope()
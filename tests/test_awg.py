@@ -0,0 +1,166 @@
+"""Tests of the AWG helpers."""
+
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from picoscope import picobase
+
+from conftest import FakeScope
+
+# sweeps of sample rates and of sample intervals
+TIME_INCREMENTS = np.concatenate((1.0 / np.arange(1000, 200000, 7),
+                                  np.arange(1, 5000) * 1E-9))
+
+
+def test_deltaPhase_scalar_matches_array(scope):
+    deltaPhases = scope.getAWGDeltaPhase(TIME_INCREMENTS)
+    assert deltaPhases.dtype == np.int64
+    scalars = [scope.getAWGDeltaPhase(float(t)) for t in TIME_INCREMENTS]
+    assert all(isinstance(d, int) for d in scalars)
+    np.testing.assert_array_equal(deltaPhases, scalars)
+
+
+def test_deltaPhase_matches_original_formula(scope):
+    scale = 2 ** (scope.AWGPhaseAccumulatorSize - scope.AWGBufferAddressWidth)
+    for timeIncrement in TIME_INCREMENTS:
+        samplingFrequency = 1 / timeIncrement
+        expected = int(samplingFrequency / scope.AWGDACFrequency * scale)
+        assert scope.getAWGDeltaPhase(timeIncrement) == expected
+
+
+def test_deltaPhase_exact(scope):
+    # 2 ** 18 * 5E-9 / 1E-6 = 1310.72
+    assert scope.getAWGDeltaPhaseExact(Fraction(1, 10 ** 6)) == 1310
+    assert scope.getAWGDeltaPhaseExact("5e-9") == 2 ** 18
+
+
+# ps2000a, ps2000 and ps6000 like DACs
+@pytest.mark.parametrize("interval, width",
+                         [(20.83E-9, 13), (2.0833E-8, 12), (5E-9, 14)])
+def test_deltaPhase_exact_dac_interval(interval, width):
+    class Scope(FakeScope):
+        AWGBufferAddressWidth = width
+        AWGDACInterval = interval
+        AWGDACFrequency = 1 / AWGDACInterval
+
+    scope = Scope()
+    dacFrequency = 1 / Fraction(str(interval))
+    scale = 2 ** (scope.AWGPhaseAccumulatorSize - width)
+    for deltaPhase in range(1000, 200000, 997):
+        timeIncrement = scale / (deltaPhase * dacFrequency)
+        assert scope.getAWGDeltaPhaseExact(timeIncrement) == deltaPhase
+        assert scope.getAWGDeltaPhaseExact(
+            timeIncrement * (1 + Fraction(1, 10 ** 9))) == deltaPhase - 1
+
+
+def test_deltaPhase_exact_dac_frequency():
+    # ps4000 defines the DAC frequency, and the interval from it
+    class Scope(FakeScope):
+        AWGDACFrequency = 192000
+        AWGDACInterval = 1 / AWGDACFrequency
+
+    scope = Scope()
+    scale = 2 ** (scope.AWGPhaseAccumulatorSize - scope.AWGBufferAddressWidth)
+    assert scope.getAWGDeltaPhaseExact(Fraction(scale, 192000 * 3)) == 3
+
+
+def test_timeIncrement_round_trip(scope):
+    deltaPhase = np.array([1, 2 ** 10, 2 ** 18])
+    timeIncrement = scope.getAWGTimeIncrement(deltaPhase)
+    np.testing.assert_allclose(timeIncrement,
+                               5E-9 * 2 ** 18 / deltaPhase)
+    assert scope.getAWGTimeIncrement(2 ** 18) == timeIncrement[2]
+
+
+@pytest.fixture
+def sine():
+    return np.sin(np.linspace(0, 2 * np.pi, 1000, endpoint=False)) + 0.5
+
+
+def test_quantize_autoscale(scope, sine):
+    (waveform, offsetVoltage, pkToPk) = scope._quantizeAWGWaveform(
+        sine, None, None, scope.AWG_INDEX_MODES["Single"])
+    assert waveform.dtype == np.int16
+    assert offsetVoltage == pytest.approx(0.5)
+    assert pkToPk == pytest.approx(2.0)
+    assert waveform.min() == scope.AWGMinVal
+    assert waveform.max() == scope.AWGMaxVal
+
+    # float64 reference of the scaling
+    scale = (scope.AWGMaxVal - scope.AWGMinVal) / pkToPk
+    reference = np.rint((sine - offsetVoltage) * scale +
+                        (scope.AWGMaxVal + scope.AWGMinVal) / 2)
+    assert np.abs(waveform - reference).max() <= 1
+
+
+def test_quantize_clips(scope, sine):
+    (waveform, _, _) = scope._quantizeAWGWaveform(
+        sine, 0.5, 1.0, scope.AWG_INDEX_MODES["Single"])
+    assert waveform.min() == scope.AWGMinVal
+    assert waveform.max() == scope.AWGMaxVal
+
+
+def test_quantize_quad_offset(scope, sine):
+    (_, offsetVoltage, _) = scope._quantizeAWGWaveform(
+        sine, None, None, scope.AWG_INDEX_MODES["Quad"])
+    assert offsetVoltage == sine[0]
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_quantize_numba_matches_numpy(scope, sine, monkeypatch, dtype):
+    pytest.importorskip("numba")
+    sine = sine.astype(dtype)
+    (waveform, _, _) = scope._quantizeAWGWaveform(
+        sine, None, None, scope.AWG_INDEX_MODES["Single"])
+    monkeypatch.setattr(picobase, "_quantizeAWGNumba", None)
+    (reference, _, _) = scope._quantizeAWGWaveform(
+        sine, None, None, scope.AWG_INDEX_MODES["Single"])
+    assert np.abs(waveform - reference.astype(np.int32)).max() <= 1
+
+
+def test_setAWGSimpleDeltaPhase_cache(scope, sine):
+    scope.setAWGSimpleDeltaPhase(sine, 2 ** 18)
+    first = scope._awg_cache
+    uploaded = scope.awgWaveform
+    scope.setAWGSimpleDeltaPhase(sine, 2 ** 18)
+    assert scope._awg_cache is first
+    np.testing.assert_array_equal(scope.awgWaveform, uploaded)
+
+    # changing the caller's array in place must not reuse the old samples
+    sine *= 0.5
+    scope.setAWGSimpleDeltaPhase(sine, 2 ** 18)
+    assert scope._awg_cache is not first
+
+    # neither must different scaling parameters
+    second = scope._awg_cache
+    scope.setAWGSimpleDeltaPhase(sine, 2 ** 18, pkToPk=4.0)
+    assert scope._awg_cache is not second
+    assert scope.awgWaveform.max() < scope.AWGMaxVal
+
+
+def test_setAWGSimpleDeltaPhase_out(scope, sine):
+    out = np.empty(sine.shape, dtype=np.int16)
+    scope.setAWGSimpleDeltaPhase(sine, 2 ** 18, out=out)
+    assert scope._awg_cache is None
+    np.testing.assert_array_equal(scope.awgWaveform, out)
+    assert out.max() == scope.AWGMaxVal
+
+    with pytest.raises(ValueError):
+        scope.setAWGSimpleDeltaPhase(sine, 2 ** 18, out=out[:10])
+    with pytest.raises(TypeError):
+        scope.setAWGSimpleDeltaPhase(sine, 2 ** 18,
+                                     out=np.empty(sine.shape))
+
+
+def test_setAWGSimpleDeltaPhase_int16(scope):
+    waveform = np.arange(0, 4000, 2, dtype=np.int16)[::2]
+    duration = scope.setAWGSimpleDeltaPhase(waveform, 2 ** 18)
+    np.testing.assert_array_equal(scope.awgWaveform, waveform)
+    assert duration == pytest.approx(5E-9 * len(waveform))
@@ -0,0 +1,142 @@
+"""Tests of the buffer registration done by getDataRaw and friends."""
+
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy as np
+import pytest
+
+N = 100
+
+
+def test_getDataRaw_clears_buffer(scope):
+    (data, returned, overflow) = scope.getDataRaw('A', N)
+    assert returned == N
+    assert not overflow
+    np.testing.assert_array_equal(data, scope.sample(0, 0, N))
+    assert scope.calls == ["SetDataBuffer", "GetValues", "ClearDataBuffer"]
+    scope.checkBindings()
+    assert not scope._boundBuffers
+
+
+def test_keepBuffer_registers_once(scope):
+    data = np.zeros(N, dtype=np.int16)
+    for _ in range(3):
+        scope.getDataRaw('A', N, data=data, keepBuffer=True)
+    assert scope.calls.count("SetDataBuffer") == 1
+    assert "ClearDataBuffer" not in scope.calls
+    scope.checkBindings()
+
+    scope.releaseBuffers()
+    scope.checkBindings()
+    assert not scope.registered
+
+
+def test_bulk_read_unbinds_kept_buffer(scope):
+    data = np.zeros(N, dtype=np.int16)
+    scope.getDataRaw('A', N, data=data, keepBuffer=True)
+    scope.noSegments = 2
+    scope.getDataRawBulk('A', N)
+    scope.checkBindings()
+    assert (0, 0) not in scope._boundBuffers
+
+    # The bulk read cleared the driver's registration, so this has to
+    # register the array again instead of transferring into nothing.
+    data[:] = 0
+    scope.getDataRaw('A', N, data=data, keepBuffer=True)
+    np.testing.assert_array_equal(data, scope.sample(0, 0, N))
+    scope.checkBindings()
+
+
+def test_failed_transfer_stays_tracked(scope):
+    data = np.zeros(N, dtype=np.int16)
+    scope.getDataRaw('A', N, data=data, keepBuffer=True)
+    scope.getValuesError = IOError("PICO_NOT_USED_IN_THIS_CAPTURE_MODE")
+    with pytest.raises(IOError):
+        scope.getDataRaw('A', N, data=data, keepBuffer=True)
+    scope.checkBindings()
+
+    scope.getValuesError = IOError("PICO_NOT_USED_IN_THIS_CAPTURE_MODE")
+    with pytest.raises(IOError):
+        scope.getDataRaw('B', N)
+    scope.checkBindings()
+
+    scope.releaseBuffers()
+    assert not scope.registered
+
+
+def test_bindDataBuffer(scope):
+    data = scope.bindDataBuffer('B', numSamples=N)
+    assert data.shape == (N,)
+    scope.checkBindings()
+    (out, _, _) = scope.getDataRaw('B', N, keepBuffer=True)
+    assert out is data
+    assert scope.calls.count("SetDataBuffer") == 1
+
+    other = np.empty(N, dtype=np.int16)
+    scope.bindDataBuffer('B', other)
+    scope.checkBindings()
+    assert scope.registered[(1, 0)] is other
+
+    with pytest.raises(TypeError):
+        scope.bindDataBuffer('B', np.empty(N, dtype=np.float32))
+
+
+def test_setup_changes_release_buffers(scope):
+    data = np.zeros(N, dtype=np.int16)
+    scope.getDataRaw('A', N, data=data, keepBuffer=True)
+    scope.getDataRaw('B', N, keepBuffer=True)
+    scope.setChannel('B', 'DC', 1.0)
+    assert not scope._boundBuffers
+    assert not scope._captureBuffers
+    assert not scope.registered
+
+    scope.getDataRaw('A', N, data=data, keepBuffer=True)
+    scope.memorySegments(2)
+    assert not scope._boundBuffers
+    assert not scope.registered
+
+    scope.getDataRaw('A', N // 2, data=data, keepBuffer=True)
+    scope.checkBindings()
+    assert scope.registered[(0, 0)] is data
+
+
+def test_preallocate_keepBuffer_channels_do_not_alias(scope):
+    scope.preallocate(N)
+    (a, _, _) = scope.getDataRaw('A', N, keepBuffer=True)
+    (b, _, _) = scope.getDataRaw('B', N, keepBuffer=True)
+    assert not np.shares_memory(a, b)
+    assert not np.shares_memory(a, scope._preallocated)
+    np.testing.assert_array_equal(a, scope.sample(0, 0, N))
+    np.testing.assert_array_equal(b, scope.sample(1, 0, N))
+
+    bound = scope.bindDataBuffer('A', segmentIndex=1, numSamples=N)
+    assert not np.shares_memory(bound, scope._preallocated)
+
+
+def test_preallocate_views(scope):
+    scope.preallocate(N, 2)
+    (data, _, _) = scope.getDataRaw('A', N // 2)
+    assert np.shares_memory(data, scope._preallocated)
+    scope.noSegments = 2
+    (bulk, _, _) = scope.getDataRawBulk('A', N)
+    assert bulk.shape == (2, N)
+    assert np.shares_memory(bulk, scope._preallocated)
+
+    # too small for the request, so a new array is allocated
+    (data, _, _) = scope.getDataRaw('A', 2 * N)
+    assert not np.shares_memory(data, scope._preallocated)
+
+    scope.preallocate(0)
+    assert scope._preallocated is None
+
+
+@pytest.mark.parametrize("shape", [(1, N), (3, N), (2, N - 1), (2 * N,)])
+def test_getDataRawBulk_checks_shape(scope, shape):
+    scope.noSegments = 2
+    with pytest.raises(ValueError):
+        scope.getDataRawBulk('A', N, data=np.empty(shape, dtype=np.int16))
+    assert not scope.calls
+    scope.checkBindings()
@@ -0,0 +1,42 @@
+"""Tests of the channel range selection of setChannel."""
+
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+
+
+@pytest.mark.parametrize("VRange, actual", [
+    (2.0, 2.0),            # exact range
+    ('50 mV', 50E-3),      # range string
+    (1.5, 2.0),            # next largest range
+    (0.0, 20E-3),          # smallest range
+    (2.00005, 2.0),        # within the tolerance of a range
+    (5.0, 5.0),            # largest range
+])
+def test_setChannel_range(scope, VRange, actual):
+    assert scope.setChannel('B', 'DC', VRange) == pytest.approx(actual)
+    assert scope.CHRange[1] == pytest.approx(actual)
+    assert scope._a2v[1] == pytest.approx(actual / scope.getMaxValue())
+    assert scope.CHCoupling[1] == scope.CHANNEL_COUPLINGS['DC']
+
+
+def test_setChannel_probeAttenuation(scope):
+    # 20 V with a 10x probe is the 2 V range of the scope
+    assert scope.setChannel('A', 'AC', 20.0, 5.0,
+                            probeAttenuation=10.0) == pytest.approx(20.0)
+    assert scope.CHOffset == [5.0, 0.0]
+    assert scope.ProbeAttenuation == [10.0, 1.0]
+    assert scope.setChannel('A', 'AC', 15.0,
+                            probeAttenuation=10.0) == pytest.approx(20.0)
+
+
+def test_setChannel_invalid_range(scope):
+    with pytest.raises(ValueError):
+        scope.setChannel('A', 'DC', 5.1)
+    with pytest.raises(ValueError):
+        scope.setChannel('A', 'DC', '3 V')
+    assert "SetChannel" not in scope.calls
+    assert scope.CHRange == [5.0, 5.0]
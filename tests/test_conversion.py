@@ -0,0 +1,178 @@
+"""Tests of the conversion of raw data to volts and the getData*V calls."""
+
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy as np
+import pytest
+
+from picoscope import picobase
+
+N = 100
+
+
+@pytest.fixture
+def setUp(scope):
+    scope.setChannel('A', 'DC', 2.0, 0.5)
+    scope.setChannel('B', 'DC', 0.2, -0.1)
+    return scope
+
+
+def assertVolts(actual, desired):
+    """Compare voltages up to float32 precision of the full scale."""
+    np.testing.assert_allclose(actual, desired, rtol=1E-6, atol=1E-6)
+
+
+def expected(scope, channel, raw):
+    """Return `raw` of `channel` in volts, computed in float64."""
+    return (raw * (scope.CHRange[channel] / scope.getMaxValue()) -
+            scope.CHOffset[channel])
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_rawToV(setUp, dtype):
+    raw = np.arange(-1000, 1000, 7, dtype=np.int16)
+    dataV = setUp.rawToV('A', raw, dtype=dtype)
+    assert dataV.dtype == dtype
+    assertVolts(dataV, expected(setUp, 0, raw))
+
+
+def test_rawToV_into_array(setUp):
+    raw = np.arange(-1000, 1000, 7, dtype=np.int16)
+    dataV = np.empty(raw.shape, dtype=np.float64)
+    assert setUp.rawToV(1, raw, dataV) is dataV
+    assertVolts(dataV, expected(setUp, 1, raw))
+
+
+def test_rawToV_strided_and_2d(setUp):
+    raw = np.arange(-3000, 3000, dtype=np.int16).reshape(20, 300)
+    assertVolts(setUp.rawToV('B', raw[:, ::3]),
+                expected(setUp, 1, raw[:, ::3]))
+    assertVolts(setUp.rawToV('B', raw), expected(setUp, 1, raw))
+
+
+def test_rawToV_blocks(setUp, monkeypatch):
+    # the blocked numpy path is only taken without numba
+    monkeypatch.setattr(picobase, "_scaleRawNumba", None)
+    size = 2 * setUp._RAW_TO_V_BLOCK + 5
+    raw = (np.arange(size) % 60000 - 30000).astype(np.int16)
+    assertVolts(setUp.rawToV('A', raw), expected(setUp, 0, raw))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_rawToV_numba_matches_numpy(setUp, monkeypatch, dtype):
+    pytest.importorskip("numba")
+    raw = np.arange(-30000, 30000, 3, dtype=np.int16)
+    dataV = setUp.rawToV('A', raw, dtype=dtype)
+    monkeypatch.setattr(picobase, "_scaleRawNumba", None)
+    assertVolts(dataV, setUp.rawToV('A', raw, dtype=dtype))
+
+
+def test_rawToVMulti(setUp):
+    raw = np.arange(-1000, 1000, dtype=np.int16).reshape(2, 1000)
+    dataV = setUp.rawToVMulti(['A', 'B'], raw)
+    assert dataV.dtype == np.float32
+    for row, channel in enumerate(['A', 'B']):
+        assertVolts(dataV[row], setUp.rawToV(channel, raw[row]))
+
+    dataV = np.empty(raw.shape, dtype=np.float64)
+    assert setUp.rawToVMulti([1, 0], raw, dataV) is dataV
+    assertVolts(dataV[0], expected(setUp, 1, raw[0]))
+    assertVolts(dataV[1], expected(setUp, 0, raw[1]))
+
+
+def test_channel_settings_stay_lists(setUp):
+    assert setUp.CHRange == [2.0, 0.2]
+    assert setUp.CHOffset == [0.5, -0.1]
+    assert setUp.getScaleAndOffset('B') == {
+        'scale': 0.2 / setUp.getMaxValue(), 'offset': -0.1}
+
+
+def test_getDataV(setUp):
+    dataV = setUp.getDataV('A', N)
+    assertVolts(dataV, expected(setUp, 0, setUp.sample(0, 0, N)))
+
+    dataV = np.zeros(2 * N)
+    (out, overflow) = setUp.getDataV('A', N, dataV=dataV,
+                                     returnOverflow=True)
+    assert out is dataV
+    assert not overflow
+    assert np.isnan(dataV[N:]).all()
+
+    dataV[:] = 0
+    setUp.getDataV('A', N, dataV=dataV, fillTail=False)
+    assert not dataV[N:].any()
+    assert not setUp.registered
+
+
+def test_getDataVMulti(setUp):
+    (dataV, overflow) = setUp.getDataVMulti(['A', 'B'], N,
+                                            returnOverflow=True)
+    assert dataV.shape == (2, N)
+    assert overflow == [False, False]
+    for channel in range(2):
+        assertVolts(
+            dataV[channel],
+            expected(setUp, channel, setUp.sample(channel, 0, N)))
+
+    dataV = np.zeros((2, 2 * N), dtype=np.float32)
+    setUp.getDataVMulti(['A', 'B'], N, dataV=dataV)
+    assert np.isnan(dataV[:, N:]).all()
+    assert not setUp.registered
+
+
+def test_getDataVBulk(setUp):
+    setUp.noSegments = 3
+    (dataV, numSamples, overflow) = setUp.getDataVBulk('B', N)
+    assert dataV.shape == (3, N)
+    assert numSamples == N
+    assert not overflow.any()
+    for segment in range(3):
+        assertVolts(
+            dataV[segment], expected(setUp, 1, setUp.sample(1, segment, N)))
+
+    dataRaw = np.empty((2, N), dtype=np.int16)
+    dataV = np.empty((2, N), dtype=np.float64)
+    (out, _, _) = setUp.getDataVBulk('A', N, 1, 2, dataV=dataV,
+                                     dataRaw=dataRaw)
+    assert out is dataV
+    np.testing.assert_array_equal(dataRaw[1], setUp.sample(0, 2, N))
+    setUp.checkBindings()
+    assert not setUp.registered
+
+
+def test_captureBlocksV(setUp):
+    (dataV, overflow) = setUp.captureBlocksV('A', 3, N)
+    assert dataV.shape == (3, N)
+    assert overflow.dtype == bool
+    assert not overflow.any()
+    assert setUp.calls.count("RunBlock") == 3
+    # one registration, kept until the last transfer
+    assert setUp.calls.count("SetDataBuffer") == 1
+    for row in dataV:
+        assertVolts(row, expected(setUp, 0, setUp.sample(0, 0, N)))
+    setUp.checkBindings()
+    assert not setUp.registered
+
+
+def test_captureBlocksV_no_captures(setUp):
+    with pytest.raises(ValueError):
+        setUp.captureBlocksV('A', 0, N)
+    assert "RunBlock" not in setUp.calls
+
+
+def test_iterDataRawBulk(setUp):
+    setUp.noSegments = 2
+    runs = list(setUp.iterDataRawBulk('B', 3, N))
+    assert len(runs) == 3
+    assert setUp.calls.count("RunBlock") == 3
+    (data0, _), (data1, _), (data2, _) = runs
+    assert not np.shares_memory(data0, data1)
+    assert data2 is data0
+    for segment in range(2):
+        np.testing.assert_array_equal(data1[segment],
+                                      setUp.sample(1, segment, N))
+    setUp.checkBindings()
+    assert not setUp.registered
@@ -0,0 +1,66 @@
+"""Tests of the patched library cache used on macOS."""
+
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import subprocess
+
+import pytest
+
+darwin_utils = pytest.importorskip("picoscope.darwin_utils")
+
+
+class FakePopen(object):
+    """Records the install_name_tool commands instead of running them."""
+
+    commands = []
+    returncode = 0
+
+    def __init__(self, command):
+        self.commands.append(command)
+
+    def wait(self):
+        return self.returncode
+
+
+@pytest.fixture
+def libraries(tmp_path, monkeypatch):
+    picoLibPath = tmp_path / "lib"
+    picoLibPath.mkdir()
+    for name in ("libiomp5.dylib", "libpicoipp.dylib", "libps2000a.dylib",
+                 "libps5000a.dylib"):
+        (picoLibPath / name).write_bytes(b"")
+    FakePopen.commands = []
+    FakePopen.returncode = 0
+    monkeypatch.setattr(darwin_utils.subprocess, "Popen", FakePopen)
+    cacheDir = tmp_path / "cache"
+    return (str(picoLibPath) + "/", cacheDir, str(cacheDir / "sig") + "/")
+
+
+def test_patchLibraries(libraries):
+    (picoLibPath, cacheDir, patchedPicoPath) = libraries
+    darwin_utils._patchLibraries(picoLibPath, cacheDir, patchedPicoPath,
+                                 ["libpicoipp.dylib"])
+    # only the finished copy is left in the cache
+    assert [p.name for p in cacheDir.iterdir()] == ["sig"]
+    assert (cacheDir / "sig" / "libps2000a.dylib").is_file()
+
+    commands = FakePopen.commands
+    assert len(commands) == 3
+    assert commands[0][:3] == ["install_name_tool", "-change",
+                               "libiomp5.dylib"]
+    rpaths = sorted(command[-1].rsplit("/", 1)[1] for command in commands[1:]
+                    if command[1] == "-add_rpath")
+    assert rpaths == ["libps2000a.dylib", "libps5000a.dylib"]
+
+
+def test_patchLibraries_failure(libraries):
+    (picoLibPath, cacheDir, patchedPicoPath) = libraries
+    FakePopen.returncode = 1
+    with pytest.raises(subprocess.CalledProcessError):
+        darwin_utils._patchLibraries(picoLibPath, cacheDir, patchedPicoPath,
+                                     ["libpicoipp.dylib"])
+    # no half patched cache is left behind
+    assert list(cacheDir.iterdir()) == []
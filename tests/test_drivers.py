@@ -0,0 +1,62 @@
+"""Tests of driver classes, with the driver library replaced."""
+
+from __future__ import division
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+
+from picoscope import ps2000, ps3000
+
+
+class FakeFunction(object):
+    """Stand in for a ctypes function, which can be given argtypes."""
+
+    def __init__(self, function):
+        self.function = function
+        self.argtypes = None
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.function(*args)
+
+
+class FakeTimebaseLibrary(object):
+    """Library whose first 5 timebases are valid, 10 nS apart."""
+
+    def __init__(self, prefix):
+        def getTimebase(handle, timebase, noSamples, timeInterval, *args):
+            if timebase.value >= 5:
+                return 0
+            timeInterval._obj.value = 10 * (timebase.value + 1)
+            return 1
+
+        self.get_timebase = FakeFunction(getTimebase)
+        setattr(self, prefix + "_get_timebase", self.get_timebase)
+        for name in ("_ready", "_get_values"):
+            setattr(self, prefix + name, FakeFunction(lambda *args: 1))
+
+
+@pytest.mark.parametrize("module, cls, prefix",
+                         [(ps2000, "PS2000", "ps2000"),
+                          (ps3000, "PS3000", "ps3000")])
+def test_timebase_intervals_cached(monkeypatch, module, cls, prefix):
+    lib = FakeTimebaseLibrary(prefix)
+    scopeClass = getattr(module, cls)
+    monkeypatch.setattr(scopeClass, "_loadLibrary",
+                        staticmethod(lambda loader, fileName: lib))
+    ps = scopeClass(connect=False)
+    ps.handle = 1
+
+    assert ps.getTimeBaseNum(31E-9) == 2
+    assert ps.getTimestepFromTimebase(4) == pytest.approx(50E-9)
+    assert lib.get_timebase.calls == ps.MAX_TIMEBASES
+    assert not ps._timebase_cache
+
+    ps._clearTimebaseCache()
+    assert ps._timebaseIntervalsCache is None
+    assert ps.getTimeBaseNum(1E-9) == 0
+    assert lib.get_timebase.calls == 2 * ps.MAX_TIMEBASES
+    ps.handle = None
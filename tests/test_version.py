@@ -0,0 +1,11 @@
+"""Tests of the lazily computed package version."""
+
+import picoscope
+
+
+def test_version_lazy():
+    picoscope.__dict__.pop('__version__', None)
+    version = picoscope.__version__
+    assert isinstance(version, str) and version
+    # computed once, then stored as a plain module attribute
+    assert picoscope.__dict__['__version__'] == version